@@ -6,7 +6,6 @@ impersonation -- the same approach as the sync client.
 
 from __future__ import annotations
 
-import json
 import logging
 import random
 import time
@@ -14,7 +13,7 @@ from typing import Any
 
 from curl_cffi.requests import AsyncSession as CffiAsyncSession
 
-from .client import MetaAdsClient
+from .client import MetaAdsClient, _loads_response
 from .constants import (
     DOC_ID_SEARCH,
     DOC_ID_TYPEAHEAD,
@@ -627,11 +626,7 @@ class AsyncMetaAdsClient:
                 f"GraphQL request failed with status {response.status_code}"
             )
 
-        text = response.text
-        if text.startswith("for (;;);"):
-            text = text[9:]
-
-        data = json.loads(text)
+        data = _loads_response(response.text)
 
         if "errors" in data:
             errors = data["errors"]
@@ -695,11 +690,7 @@ class AsyncMetaAdsClient:
                 logger.error("Typeahead request failed: %d", response.status_code)
                 return []
 
-            text = response.text
-            if text.startswith("for (;;);"):
-                text = text[9:]
-
-            data = json.loads(text)
+            data = _loads_response(response.text)
             return self._parse_typeahead_response(data)
 
         except Exception as exc:
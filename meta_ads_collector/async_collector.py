@@ -97,6 +97,10 @@ class AsyncMetaAdsCollector:
     SORT_RELEVANCY = SORT_RELEVANCY
     SORT_IMPRESSIONS = SORT_IMPRESSIONS
 
+    # Default for ``keep_raw_data``; also covers subclasses whose
+    # ``__init__`` does not call ours.
+    keep_raw_data = True
+
     def __init__(
         self,
         proxy: str | list[str] | ProxyPool | None = None,
@@ -105,6 +109,7 @@ class AsyncMetaAdsCollector:
         timeout: int = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         callbacks: dict[str, Callable] | None = None,
+        keep_raw_data: bool = True,
     ) -> None:
         """Initialize the async collector.
 
@@ -115,6 +120,7 @@ class AsyncMetaAdsCollector:
             timeout: Request timeout (seconds).
             max_retries: Maximum retry attempts per request.
             callbacks: Optional mapping of event type strings to callbacks.
+            keep_raw_data: Keep each ad's GraphQL payload on ``Ad.raw_data``.
         """
         self.client = AsyncMetaAdsClient(
             proxy=proxy,
@@ -123,6 +129,7 @@ class AsyncMetaAdsCollector:
         )
         self.rate_limit_delay = rate_limit_delay
         self.jitter = jitter
+        self.keep_raw_data = keep_raw_data
 
         # Event emitter
         self.event_emitter = EventEmitter()
@@ -343,7 +350,7 @@ class AsyncMetaAdsCollector:
                         break
 
                     try:
-                        ad = Ad.from_graphql_response(ad_data)
+                        ad = Ad.from_graphql_response(ad_data, keep_raw=self.keep_raw_data)
 
                         if dedup_tracker is not None and dedup_tracker.has_seen(ad.id):
                             continue
@@ -447,7 +447,7 @@ def _write_ads_to_file(
     if extension == ".jsonl":
         with open(path, "w", encoding="utf-8") as f:
             for ad in ads_iter:
-                f.write(_json.dumps(ad.to_dict(include_raw=include_raw), ensure_ascii=False))
+                f.write(ad.to_json(include_raw=include_raw, indent=None))
                 f.write("\n")
                 count += 1
     elif extension == ".csv":
@@ -575,7 +575,7 @@ def _run_search_pages(args: argparse.Namespace) -> int:
         logger.info("\nSearch interrupted by user")
         return 130
     except Exception as e:
-        logger.error(f"Page search failed: {e}")
+        logger.error("Page search failed: %s", e)
         if args.verbose:
             import traceback
             traceback.print_exc()
@@ -608,7 +608,7 @@ def main() -> int:
     extension = output_path.suffix.lower()
 
     if extension not in [".json", ".csv", ".jsonl"]:
-        logger.error(f"Unsupported output format: {extension}")
+        logger.error("Unsupported output format: %s", extension)
         logger.error("Supported formats: .json, .csv, .jsonl")
         return 1
 
@@ -681,7 +681,7 @@ def main() -> int:
             page_name = getattr(args, "page_name", None)
 
             if page_url:
-                logger.info(f"Collecting ads from page URL: {page_url}")
+                logger.info("Collecting ads from page URL: %s", page_url)
                 # Use collect_by_page_url with search params as kwargs
                 page_kwargs = {
                     "country": args.country.upper(),
@@ -695,7 +695,7 @@ def main() -> int:
                 }
                 params = None  # signal to use page mode below
             elif page_name:
-                logger.info(f"Resolving page name: {page_name!r}")
+                logger.info("Resolving page name: %r", page_name)
                 page_kwargs = {
                     "country": args.country.upper(),
                     "ad_type": map_ad_type(args.ad_type),
@@ -708,7 +708,7 @@ def main() -> int:
                 }
                 params = None  # signal to use page mode below
             else:
-                logger.info(f"Starting collection: query='{args.query}', country={args.country}")
+                logger.info("Starting collection: query='%s', country=%s", args.query, args.country)
 
             # Resolve download-media / enrich flags
             download_media = getattr(args, "download_media", False) and not getattr(
@@ -747,10 +747,10 @@ def main() -> int:
                 )
 
                 logger.info("Media download summary:")
-                logger.info(f"  Attempted:   {media_stats['attempted']}")
-                logger.info(f"  Succeeded:   {media_stats['succeeded']}")
-                logger.info(f"  Failed:      {media_stats['failed']}")
-                logger.info(f"  Total bytes: {media_stats['total_bytes']:,}")
+                logger.info("  Attempted:   %s", media_stats['attempted'])
+                logger.info("  Succeeded:   %s", media_stats['succeeded'])
+                logger.info("  Failed:      %s", media_stats['failed'])
+                logger.info("  Total bytes: %s", format(media_stats['total_bytes'], ","))
 
             # ── Standard (no media) path ─────────────────────────
             elif params is not None:
@@ -798,13 +798,13 @@ def main() -> int:
             stats = collector.get_stats()
             logger.info("=" * 50)
             logger.info("Collection Complete!")
-            logger.info(f"  Ads collected: {count}")
-            logger.info(f"  Requests made: {stats['requests_made']}")
-            logger.info(f"  Pages fetched: {stats['pages_fetched']}")
-            logger.info(f"  Errors: {stats['errors']}")
+            logger.info("  Ads collected: %s", count)
+            logger.info("  Requests made: %s", stats['requests_made'])
+            logger.info("  Pages fetched: %s", stats['pages_fetched'])
+            logger.info("  Errors: %s", stats['errors'])
             if stats.get("duration_seconds"):
-                logger.info(f"  Duration: {stats['duration_seconds']:.2f}s")
-            logger.info(f"  Output: {output_path}")
+                logger.info("  Duration: %.2fs", stats['duration_seconds'])
+            logger.info("  Output: %s", output_path)
             logger.info("=" * 50)
 
             # Generate collection report if requested
@@ -839,7 +839,7 @@ def main() -> int:
         logger.info("\nCollection interrupted by user")
         return 130
     except Exception as e:
-        logger.error(f"Collection failed: {e}")
+        logger.error("Collection failed: %s", e)
         if args.verbose:
             import traceback
             traceback.print_exc()
@@ -42,6 +42,29 @@ from .proxy_pool import ProxyPool
 
 logger = logging.getLogger(__name__)
 
+# Facebook prefixes JSON responses with an XSSI guard.
+_XSSI_PREFIX = "for (;;);"
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _loads_response(text: str) -> Any:
+    """Decode a JSON response body, skipping the ``for (;;);`` guard.
+
+    Behaves like :func:`json.loads` on the text after the prefix, but the
+    prefix is skipped by offset: slicing it off would first copy the whole
+    body, which for search pages runs to megabytes.
+    """
+    start = len(_XSSI_PREFIX) if text.startswith(_XSSI_PREFIX) else 0
+    while start < len(text) and text[start] in " \t\n\r":
+        start += 1
+    data, end = _JSON_DECODER.raw_decode(text, start)
+    # Only JSON whitespace may follow the value, as with json.loads.
+    while end < len(text) and text[end] in " \t\n\r":
+        end += 1
+    if end != len(text):
+        raise json.JSONDecodeError("Extra data", text, end)
+    return data
+
 
 class MetaAdsClient:
     """
@@ -193,7 +216,7 @@ class MetaAdsClient:
             "http": proxy_url,
             "https": proxy_url,
         }
-        logger.info(f"Proxy configured: {host}:{port}")
+        logger.info("Proxy configured: %s:%s", host, port)
 
     def _extract_tokens(self, html: str) -> dict[str, str]:
         """Extract required tokens from the Ad Library HTML page."""
@@ -295,7 +318,7 @@ class MetaAdsClient:
         if asbd_match:
             tokens["x-asbd-id"] = asbd_match.group(1)
 
-        logger.debug(f"Extracted tokens: {list(tokens.keys())}")
+        logger.debug("Extracted tokens: %s", list(tokens.keys()))
         return tokens
 
     def _extract_doc_ids(self, html: Optional[str]) -> dict[str, str]:
@@ -540,7 +563,7 @@ class MetaAdsClient:
         challenge_path = match.group(1)
         challenge_url = f"{self.BASE_URL}{challenge_path}"
 
-        logger.info(f"Handling verification challenge: {challenge_path[:50]}...")
+        logger.info("Handling verification challenge: %s...", challenge_path[:50])
 
         try:
             # POST to the challenge endpoint
@@ -572,7 +595,7 @@ class MetaAdsClient:
                     break
                 except CffiRequestException as retry_err:
                     logger.warning(
-                        f"Challenge POST attempt {attempt + 1}/3 failed: {retry_err}"
+                        "Challenge POST attempt %d/3 failed: %s", attempt + 1, retry_err,
                     )
                     if attempt < 2:
                         time.sleep(2 * (attempt + 1))
@@ -581,8 +604,8 @@ class MetaAdsClient:
                 logger.error("All challenge POST attempts failed")
                 return False
 
-            logger.debug(f"Challenge response status: {challenge_response.status_code}")
-            logger.debug(f"Challenge cookies: {list(self.session.cookies.keys())}")
+            logger.debug("Challenge response status: %s", challenge_response.status_code)
+            logger.debug("Challenge cookies: %s", list(self.session.cookies.keys()))
 
             # Check if we got the rd_challenge cookie
             if "rd_challenge" in self.session.cookies:
@@ -595,14 +618,14 @@ class MetaAdsClient:
                 for cookie in self.session.cookies:
                     name = cookie.name if hasattr(cookie, "name") else str(cookie)
                     if "challenge" in name.lower() or "rd_" in name.lower():
-                        logger.info(f"Challenge completed - {name} cookie received")
+                        logger.info("Challenge completed - %s cookie received", name)
                         return True
 
             logger.warning("Challenge POST completed but no challenge cookie received")
             return False
 
         except Exception as e:
-            logger.error(f"Failed to complete challenge: {e}")
+            logger.error("Failed to complete challenge: %s", e)
             return False
 
     def initialize(self) -> bool:
@@ -623,7 +646,7 @@ class MetaAdsClient:
             self.session.cookies.set("wd", wd, domain=".facebook.com", path="/")
             self.session.cookies.set("dpr", str(self._fingerprint.dpr), domain=".facebook.com", path="/")
 
-            logger.debug(f"Set initial cookies: datr={datr[:8]}...")
+            logger.debug("Set initial cookies: datr=%s...", datr[:8])
 
             # Step 2: Load the Ad Library page with minimal parameters
             # Using sec-fetch-site: none to appear as direct navigation
@@ -642,8 +665,8 @@ class MetaAdsClient:
                 headers=init_headers,
             )
 
-            logger.debug(f"Initial request status: {response.status_code}")
-            logger.debug(f"Response cookies: {list(self.session.cookies.keys())}")
+            logger.debug("Initial request status: %s", response.status_code)
+            logger.debug("Response cookies: %s", list(self.session.cookies.keys()))
 
             # Check if we got a challenge response (403 with challenge script)
             if response.status_code == 403 or "/__rd_verify_" in response.text:
@@ -667,7 +690,7 @@ class MetaAdsClient:
                         },
                         headers=init_headers,
                     )
-                    logger.debug(f"Post-challenge attempt status: {response.status_code}")
+                    logger.debug("Post-challenge attempt status: %s", response.status_code)
 
                     # If still getting challenge, try once more
                     if response.status_code == 403 or "/__rd_verify_" in response.text:
@@ -685,11 +708,11 @@ class MetaAdsClient:
                                 },
                                 headers=init_headers,
                             )
-                            logger.debug(f"Second post-challenge attempt status: {response.status_code}")
+                            logger.debug("Second post-challenge attempt status: %s", response.status_code)
 
             if response.status_code != 200:
-                logger.error(f"Failed to load Ad Library page: {response.status_code}")
-                logger.debug(f"Response preview: {response.text[:500]}")
+                logger.error("Failed to load Ad Library page: %s", response.status_code)
+                logger.debug("Response preview: %s", response.text[:500])
                 raise AuthenticationError(
                     f"Failed to load Ad Library page (HTTP {response.status_code})"
                 )
@@ -700,7 +723,7 @@ class MetaAdsClient:
             # Attempt to extract dynamic doc_ids from the page
             self._doc_ids = self._extract_doc_ids(response.text)
 
-            logger.debug(f"Extracted tokens: {list(self._tokens.keys())}")
+            logger.debug("Extracted tokens: %s", list(self._tokens.keys()))
 
             # Verify we got the essential tokens
             if "lsd" not in self._tokens:
@@ -733,7 +756,7 @@ class MetaAdsClient:
             self._init_time = time.time()
             self._consecutive_errors = 0
             logger.info("Client initialized successfully")
-            logger.info(f"Tokens available: {list(self._tokens.keys())}")
+            logger.info("Tokens available: %s", list(self._tokens.keys()))
 
             # Add a small delay before first GraphQL request to appear more human
             time.sleep(random.uniform(1.5, 3.0))
@@ -743,7 +766,7 @@ class MetaAdsClient:
         except AuthenticationError:
             raise
         except Exception as e:
-            logger.error(f"Failed to initialize client: {e}")
+            logger.error("Failed to initialize client: %s", e)
             import traceback
             logger.debug(traceback.format_exc())
             raise AuthenticationError(f"Failed to initialize client: {e}") from e
@@ -790,7 +813,7 @@ class MetaAdsClient:
                     if self._proxy_pool and proxy_url:
                         self._proxy_pool.mark_failure(proxy_url)
                     wait_time = self.retry_delay * (2 ** attempt) + random.uniform(0, 1)
-                    logger.warning(f"Rate limited. Waiting {wait_time:.2f}s before retry...")
+                    logger.warning("Rate limited. Waiting %.2fs before retry...", wait_time)
                     time.sleep(wait_time)
                     continue
 
@@ -806,7 +829,7 @@ class MetaAdsClient:
                 if self._proxy_pool and proxy_url:
                     self._proxy_pool.mark_failure(proxy_url)
                 wait_time = self.retry_delay * (2 ** attempt) + random.uniform(0, 1)
-                logger.warning(f"Request failed (attempt {attempt + 1}/{self.max_retries}): {e}")
+                logger.warning("Request failed (attempt %d/%d): %s", attempt + 1, self.max_retries, e)
 
                 if attempt < self.max_retries - 1:
                     time.sleep(wait_time)
@@ -915,8 +938,8 @@ class MetaAdsClient:
             payload["__hblp"] = self._tokens["__hblp"]
 
         logger.debug(
-            f"Payload tokens: lsd={lsd[:10]}..., jazoest={jazoest}, "
-            f"__dyn present={bool(payload.get('__dyn'))}"
+            "Payload tokens: lsd=%s..., jazoest=%s, __dyn present=%s",
+            lsd[:10], jazoest, bool(payload.get("__dyn")),
         )
 
         return payload
@@ -1033,7 +1056,8 @@ class MetaAdsClient:
         if cursor:
             variables["cursor"] = cursor
 
-        logger.debug(f"GraphQL variables: {json.dumps(variables, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GraphQL variables: %s", json.dumps(variables, indent=2))
 
         # Build payload for search/pagination query
         # Use dynamically extracted doc_id if available, else hardcoded fallback
@@ -1069,21 +1093,18 @@ class MetaAdsClient:
         response = self._make_graphql_request(payload, headers)
 
         if response.status_code != 200:
-            logger.error(f"GraphQL request failed: {response.status_code}")
-            logger.debug(f"Response: {response.text[:500]}")
+            logger.error("GraphQL request failed: %s", response.status_code)
+            logger.debug("Response: %s", response.text[:500])
             raise MetaAdsError(f"GraphQL request failed with status {response.status_code}")
 
         # Parse response
         try:
             text = response.text
-            if text.startswith("for (;;);"):
-                text = text[9:]
-
-            logger.debug(f"GraphQL response preview: {text[:1000]}")
+            logger.debug("GraphQL response preview: %s", text[:1000])
 
-            data = json.loads(text)
+            data = _loads_response(text)
 
-            logger.debug(f"Response keys: {list(data.keys()) if isinstance(data, dict) else 'not a dict'}")
+            logger.debug("Response keys: %s", list(data.keys()) if isinstance(data, dict) else 'not a dict')
 
             # Check for errors
             if "errors" in data:
@@ -1093,20 +1114,20 @@ class MetaAdsClient:
                     error_msg = error.get("message", "Unknown error")
 
                     if error_code == 1675004 or "rate limit" in error_msg.lower():
-                        logger.warning(f"Rate limited: {error_msg}. Waiting before retry...")
+                        logger.warning("Rate limited: %s. Waiting before retry...", error_msg)
                         self._consecutive_errors += 1
                         time.sleep(5 + random.uniform(0, 3))
                         return {"ads": [], "page_info": {}, "rate_limited": True, "error": error_msg}, None
 
                     # Session/auth errors - trigger refresh
                     if error_code in (1357004, 1357001) or "session" in error_msg.lower():
-                        logger.warning(f"Session error: {error_msg}. Will refresh on next request.")
+                        logger.warning("Session error: %s. Will refresh on next request.", error_msg)
                         self._consecutive_errors += 1
                         if self._consecutive_errors >= 2:
                             self._refresh_session()
                         return {"ads": [], "page_info": {}, "session_expired": True, "error": error_msg}, None
 
-                    logger.error(f"GraphQL error: {error_msg} (code: {error_code})")
+                    logger.error("GraphQL error: %s (code: %s)", error_msg, error_code)
 
                 if not data.get("data"):
                     return {"ads": [], "page_info": {}, "error": str(errors)}, None
@@ -1117,8 +1138,8 @@ class MetaAdsClient:
             return self._parse_search_response(data)
 
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse response: {e}")
-            logger.debug(f"Response text: {response.text[:500]}")
+            logger.error("Failed to parse response: %s", e)
+            logger.debug("Response text: %s", response.text[:500])
             raise
 
     def _parse_search_response(self, data: dict[str, Any]) -> tuple[dict[str, Any], Optional[str]]:
@@ -1178,7 +1199,7 @@ class MetaAdsClient:
             return {"ads": ads, "page_info": page_info, "raw": data}, next_cursor
 
         except Exception as e:
-            logger.error(f"Failed to parse search response: {e}")
+            logger.error("Failed to parse search response: %s", e)
             return {"ads": [], "page_info": {}, "raw": data, "error": str(e)}, None
 
     def search_pages(
@@ -1245,11 +1266,7 @@ class MetaAdsClient:
                 logger.error("Typeahead request failed: %d", response.status_code)
                 return []
 
-            text = response.text
-            if text.startswith("for (;;);"):
-                text = text[9:]
-
-            data = json.loads(text)
+            data = _loads_response(response.text)
 
             if "errors" in data:
                 logger.warning("Typeahead response contained errors: %s", data["errors"])
@@ -93,6 +93,10 @@ class MetaAdsCollector:
     SORT_IMPRESSIONS = SORT_IMPRESSIONS
     SORT_DATE = None  # Not supported; falls back to server-default
 
+    # Default for ``keep_raw_data``; also covers subclasses whose
+    # ``__init__`` does not call ours.
+    keep_raw_data = True
+
     def __init__(
         self,
         proxy: Optional[Union[str, list[str], ProxyPool]] = None,
@@ -101,6 +105,7 @@ class MetaAdsCollector:
         timeout: int = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         callbacks: Optional[dict[str, Callable]] = None,
+        keep_raw_data: bool = True,
     ):
         """
         Initialize the collector.
@@ -116,6 +121,10 @@ class MetaAdsCollector:
                 functions for convenience registration. Example::
 
                     {"ad_collected": my_callback, "error_occurred": my_error_handler}
+
+            keep_raw_data: Keep each ad's GraphQL payload on ``Ad.raw_data``.
+                Set to ``False`` to cut memory on large collections; exports
+                with ``include_raw=True`` then have no raw payload to write.
         """
         self.client = MetaAdsClient(
             proxy=proxy,
@@ -124,6 +133,7 @@ class MetaAdsCollector:
         )
         self.rate_limit_delay = rate_limit_delay
         self.jitter = jitter
+        self.keep_raw_data = keep_raw_data
 
         # Event emitter for lifecycle events
         self.event_emitter = EventEmitter()
@@ -345,7 +355,7 @@ class MetaAdsCollector:
         search_session_id = str(uuid.uuid4())
         search_collation_token = str(uuid.uuid4())
 
-        logger.info(f"Starting search: query='{query}', country={country}, ad_type={ad_type}")
+        logger.info("Starting search: query='%s', country=%s, ad_type=%s", query, country, ad_type)
 
         # Emit collection_started
         self.event_emitter.emit(COLLECTION_STARTED, {
@@ -362,7 +372,7 @@ class MetaAdsCollector:
             while True:
                 # Check if we've hit our limit
                 if max_results and collected >= max_results:
-                    logger.info(f"Reached max_results limit: {max_results}")
+                    logger.info("Reached max_results limit: %s", max_results)
                     break
 
                 # Make the API request with retry logic
@@ -397,8 +407,8 @@ class MetaAdsCollector:
                             })
                             if retry_count < max_retries:
                                 logger.warning(
-                                    f"Rate limited, waiting {wait_time:.1f}s "
-                                    f"before retry {retry_count}/{max_retries}"
+                                    "Rate limited, waiting %.1fs before retry %d/%d",
+                                    wait_time, retry_count, max_retries,
                                 )
                                 time.sleep(wait_time)
                                 continue
@@ -419,7 +429,7 @@ class MetaAdsCollector:
                                 "reason": "session_expired",
                             })
                             if retry_count < max_retries:
-                                logger.warning(f"Session expired, retrying ({retry_count}/{max_retries})...")
+                                logger.warning("Session expired, retrying (%d/%d)...", retry_count, max_retries)
                                 time.sleep(2)
                                 continue
                             else:
@@ -436,7 +446,7 @@ class MetaAdsCollector:
                         break  # Success, exit retry loop
 
                     except Exception as e:
-                        logger.error(f"Search request failed: {e}")
+                        logger.error("Search request failed: %s", e)
                         self.stats["errors"] += 1
                         self.event_emitter.emit(ERROR_OCCURRED, {
                             "exception": e,
@@ -471,7 +481,7 @@ class MetaAdsCollector:
                         break
 
                     try:
-                        ad = Ad.from_graphql_response(ad_data)
+                        ad = Ad.from_graphql_response(ad_data, keep_raw=self.keep_raw_data)
 
                         # Skip already-seen ads
                         if dedup_tracker is not None and dedup_tracker.has_seen(ad.id):
@@ -495,7 +505,7 @@ class MetaAdsCollector:
                             dedup_tracker.mark_seen(ad.id)
 
                     except Exception as e:
-                        logger.warning(f"Failed to parse ad: {e}")
+                        logger.warning("Failed to parse ad: %s", e)
                         self.stats["errors"] += 1
                         self.event_emitter.emit(ERROR_OCCURRED, {
                             "exception": e,
@@ -509,7 +519,7 @@ class MetaAdsCollector:
                     break
 
                 cursor = next_cursor
-                logger.debug(f"Fetching next page (collected: {collected})")
+                logger.debug("Fetching next page (collected: %s)", collected)
 
                 # Rate limiting
                 self._delay()
@@ -521,7 +531,7 @@ class MetaAdsCollector:
             if dedup_tracker is not None:
                 dedup_tracker.update_collection_time()
                 dedup_tracker.save()
-            logger.info(f"Search completed: {collected} ads collected")
+            logger.info("Search completed: %s ads collected", collected)
             self.event_emitter.emit(COLLECTION_FINISHED, {
                 "total_ads": collected,
                 "total_pages": page_number,
@@ -768,7 +778,7 @@ class MetaAdsCollector:
 
         # Merge detail data into a *new* Ad instance.
         try:
-            enriched = Ad.from_graphql_response(detail_data)
+            enriched = Ad.from_graphql_response(detail_data, keep_raw=self.keep_raw_data)
 
             # Only update fields that are enriched (non-None in the new
             # data) and that were previously empty/None in the original.
@@ -961,7 +971,7 @@ class MetaAdsCollector:
         with open(path, "w", encoding="utf-8") as f:
             json.dump(output, f, indent=indent, ensure_ascii=False)
 
-        logger.info(f"Saved {len(ads)} ads to {output_path}")
+        logger.info("Saved %s ads to %s", len(ads), output_path)
         return len(ads)
 
     def collect_to_csv(
@@ -1075,7 +1085,7 @@ class MetaAdsCollector:
                 writer.writerow(row)
                 count += 1
 
-        logger.info(f"Saved {count} ads to {output_path}")
+        logger.info("Saved %s ads to %s", count, output_path)
         return count
 
     def collect_to_jsonl(
@@ -1123,11 +1133,11 @@ class MetaAdsCollector:
                 filter_config=filter_config,
                 dedup_tracker=dedup_tracker,
             ):
-                f.write(json.dumps(ad.to_dict(include_raw=include_raw), ensure_ascii=False))
+                f.write(ad.to_json(include_raw=include_raw, indent=None))
                 f.write("\n")
                 count += 1
 
-        logger.info(f"Saved {count} ads to {output_path}")
+        logger.info("Saved %s ads to %s", count, output_path)
         return count
 
     def get_stats(self) -> dict[str, Any]:
@@ -3,25 +3,57 @@
 Provides a :class:`JSONFormatter` that emits log records as single-line
 JSON objects and a :func:`setup_logging` helper that configures the root
 logger with a choice of text or JSON formatting and optional file output.
+:class:`LazyJSONMessage` defers JSON encoding of log arguments until a
+handler actually emits the record.
 
 Usage::
 
-    from meta_ads_collector.logging_config import setup_logging
+    from meta_ads_collector.logging_config import LazyJSONMessage, setup_logging
 
     # Standard text format at INFO level
     setup_logging(level="INFO")
 
     # JSON format with DEBUG level, also writing to a file
     setup_logging(level="DEBUG", fmt="json", log_file="/var/log/collector.log")
+
+    # Payload is only serialised if a DEBUG record is actually emitted
+    logger.debug("GraphQL response %s", LazyJSONMessage(payload))
 """
 
 from __future__ import annotations
 
+import copy
+import io
 import json
 import logging
+import logging.handlers
+import queue
 import sys
-from datetime import datetime, timezone
+import time
 from pathlib import Path
+from typing import Any
+
+
+class LazyJSONMessage:
+    """Log argument that JSON-encodes *obj* only when rendered.
+
+    ``logger.debug("payload %s", json.dumps(payload))`` pays for the
+    encoding even when DEBUG is disabled.  Passing
+    ``LazyJSONMessage(payload)`` instead defers the work to ``%s``
+    formatting, which the logging module only performs for records that
+    pass the level checks.
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return json.dumps(self.obj, ensure_ascii=False, default=str)
+
+    def __repr__(self) -> str:
+        return f"LazyJSONMessage({self.obj!r})"
 
 
 class JSONFormatter(logging.Formatter):
@@ -29,10 +61,13 @@ class JSONFormatter(logging.Formatter):
 
     Each log line is a JSON object with the following keys:
 
-    * ``timestamp`` -- ISO 8601 UTC timestamp
+    * ``timestamp`` -- ISO 8601 UTC timestamp of when the record was
+      created, with millisecond precision
     * ``level`` -- log level name (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     * ``logger`` -- logger name
-    * ``message`` -- formatted log message
+    * ``message`` -- formatted log message.  When the message is a
+      ``dict`` logged without arguments (``logger.info({"event": ...})``)
+      it is embedded as a nested JSON object rather than its ``str()``.
 
     Any extra attributes attached to the log record are merged into the
     JSON object.  Standard internal attributes (``args``, ``exc_info``,
@@ -48,14 +83,40 @@ class JSONFormatter(logging.Formatter):
         "threadName", "taskName",
     })
 
+    # (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last record.
+    # Records arrive in bursts within the same second, so the strftime
+    # result is reused and only the millisecond suffix changes.
+    _second_cache: tuple[int, str] = (-1, "")
+
+    def _format_timestamp(self, record: logging.LogRecord) -> str:
+        """Return the ISO 8601 UTC timestamp for *record*.
+
+        Uses ``record.created`` (set by the logging machinery) rather than
+        the wall clock at format time, so queued or buffered records keep
+        the time at which they were emitted.
+        """
+        second = int(record.created)
+        cached = self._second_cache
+        if cached[0] != second:
+            cached = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+            # Single attribute store of an immutable tuple -- safe when the
+            # formatter is shared between handlers on different threads.
+            self._second_cache = cached
+        return f"{cached[1]}.{int(record.msecs):03d}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format *record* as a single-line JSON string."""
+        # Structured messages are serialised as-is, skipping the
+        # ``msg % args`` pass that getMessage() would perform.
+        msg = record.msg
+        message: object = msg if isinstance(msg, dict) and not record.args else record.getMessage()
+
         # Build the core payload
         payload: dict[str, object] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._format_timestamp(record),
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            "message": message,
         }
 
         # Merge any extra attributes the caller attached to the record.
@@ -71,7 +132,96 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info and record.exc_info[1] is not None:
             payload["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(payload, ensure_ascii=False)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that batches writes through a 64 KiB buffer.
+
+    :class:`logging.FileHandler` flushes after every record, turning each
+    log line into its own ``write()`` syscall.  This handler only flushes
+    when the buffer fills, on records at ``ERROR`` or above (so failures
+    reach disk promptly), on explicit :meth:`flush`, and on close --
+    :func:`logging.shutdown` takes care of the latter at interpreter exit.
+
+    The file is opened lazily on the first emitted record.
+    """
+
+    buffer_size = 64 * 1024
+
+    def __init__(
+        self, filename: str, encoding: str | None = "utf-8", errors: str | None = None
+    ) -> None:
+        super().__init__(filename, mode="a", encoding=encoding, delay=True, errors=errors)
+
+    def _open(self) -> io.TextIOWrapper:
+        return open(
+            self.baseFilename,
+            "a",
+            encoding=self.encoding,
+            errors=self.errors,
+            buffering=self.buffer_size,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write *record* to the buffer without forcing a flush."""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _BackgroundHandler(logging.handlers.QueueHandler):
+    """Queue records for *target*, which is drained on a listener thread.
+
+    Producers only pay for an enqueue; formatting and disk I/O happen on
+    the :class:`~logging.handlers.QueueListener` thread owned by this
+    handler.  Closing the handler stops the listener (draining any queued
+    records) and closes *target*.
+    """
+
+    def __init__(self, target: logging.Handler) -> None:
+        self._records: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+        super().__init__(self._records)
+        self.target = target
+        self._listener: logging.handlers.QueueListener | None = logging.handlers.QueueListener(
+            self._records, target, respect_handler_level=True,
+        )
+        self._listener.start()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Snapshot *record* for the listener thread.
+
+        The queue never leaves this process, so unlike the base class the
+        record is not pre-formatted: ``%``-arguments are merged now (so
+        later mutation by the caller cannot change the message) while
+        ``exc_info`` and structured ``dict`` messages are left for the
+        target's formatter.
+        """
+        record = copy.copy(record)
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def flush(self) -> None:
+        """Block until queued records are written, then flush *target*."""
+        if self._listener is not None:
+            self._records.join()
+        self.target.flush()
+
+    def close(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        self.target.close()
+        super().close()
 
 
 _TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -90,8 +240,10 @@ def setup_logging(
         fmt: Output format.  ``"text"`` for human-readable output,
             ``"json"`` for machine-readable JSON lines.
         log_file: Optional path to a log file.  When provided, a
-            :class:`logging.FileHandler` is added **in addition** to
-            the console handler.
+            :class:`BufferedFileHandler` is added **in addition** to
+            the console handler.  Writes to it happen on a background
+            :class:`~logging.handlers.QueueListener` thread, so logging
+            calls never block on disk I/O.
     """
     numeric_level = getattr(logging, level.upper(), logging.INFO)
     root = logging.getLogger()
@@ -102,6 +254,7 @@ def setup_logging(
     for handler in root.handlers[:]:
         if getattr(handler, "_meta_ads_collector", False):
             root.removeHandler(handler)
+            handler.close()
 
     # Choose formatter
     if fmt == "json":
@@ -120,8 +273,11 @@ def setup_logging(
     if log_file:
         path = Path(log_file)
         path.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(str(path), encoding="utf-8")
+        file_handler = BufferedFileHandler(str(path), encoding="utf-8")
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
-        file_handler._meta_ads_collector = True  # type: ignore[attr-defined]
-        root.addHandler(file_handler)
+        queued = _BackgroundHandler(file_handler)
+        queued.setLevel(numeric_level)
+        queued.setFormatter(formatter)
+        queued._meta_ads_collector = True  # type: ignore[attr-defined]
+        root.addHandler(queued)
@@ -10,14 +10,22 @@ is never disrupted.
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import errno
+import functools
 import logging
+import operator
+import os
+import random
 import time
-from dataclasses import dataclass
+from collections.abc import Iterator
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
+from curl_cffi.requests import AsyncSession as CffiAsyncSession
 from curl_cffi.requests import Session as CffiSession
 from curl_cffi.requests.exceptions import ConnectionError as CffiConnectionError
 from curl_cffi.requests.exceptions import HTTPError as CffiHTTPError
@@ -60,16 +68,372 @@ _MEDIA_FIELDS: list[tuple[str, str]] = [
     ("thumbnail_url", "thumbnail"),
 ]
 
-# Streaming chunk size (64 KiB).
+# Precompiled accessors for _MEDIA_FIELDS, used on every creative.
+_MEDIA_GETTERS: list[tuple[operator.attrgetter[Any], str]] = [
+    (operator.attrgetter(field_name), media_type) for field_name, media_type in _MEDIA_FIELDS
+]
+
+# Once the (decayed) attempt count reaches _PREFLIGHT_MIN_URLS -- about a
+# dozen downloads -- and this fraction of the recent ones hit 403 (expired
+# CDN token), each download first sends a body-less HEAD request so
+# expired URLs are rejected in one round trip.  While URLs are fresh the
+# extra round trip is skipped.
+_PREFLIGHT_403_RATE: float = 0.2
+_PREFLIGHT_MIN_URLS: int = 10
+# "Recent" is an exponential decay: both counters are multiplied by this
+# factor on every attempt, so a download's weight halves after ~22 more
+# and an early burst of expired URLs stops forcing preflights.
+_PREFLIGHT_DECAY: float = 1 - 1 / 32
+
+# Disk write batch size (64 KiB).  libcurl hands over the body in pieces
+# of at most 16 KiB, which are coalesced into writes of this size.
 _CHUNK_SIZE: int = 65_536
 
+# Flags for the raw output descriptor.  ``O_BINARY`` only exists (and is
+# only needed) on Windows.
+_OPEN_FLAGS: int = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+# Files at least this large (typically videos) have their pages dropped
+# from the OS page cache once written -- they are rarely read back on the
+# collecting host.  Only available where ``posix_fadvise`` exists.
+_DONTNEED_THRESHOLD: int = 1 << 20
+_HAS_FADVISE: bool = hasattr(os, "posix_fadvise")
+
+
+def _release_page_cache(fd: int) -> None:
+    """Advise the kernel that the data written to *fd* will not be reused.
+
+    Best effort: a no-op on platforms without ``posix_fadvise`` and on
+    filesystems that reject the hint.
+    """
+    if _HAS_FADVISE:
+        with contextlib.suppress(OSError):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+# Flags for reopening a partial download to resume it with a Range request.
+_RESUME_FLAGS: int = os.O_WRONLY | getattr(os, "O_BINARY", 0)
+
+_HAS_FALLOCATE: bool = hasattr(os, "posix_fallocate")
+
+
+def _content_length(response: Any) -> int:
+    """Return the ``Content-Length`` of *response*, or 0 if unknown."""
+    try:
+        return max(0, int(response.headers.get("Content-Length", 0)))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _preallocate(fd: int, length: int) -> None:
+    """Reserve *length* bytes on disk for *fd* before writing to it.
+
+    One up-front allocation avoids extent fragmentation and surfaces a
+    full disk before any bytes are downloaded: ``ENOSPC``/``EDQUOT``
+    propagate as :class:`OSError`.  Filesystems that do not support
+    preallocation are silently skipped.
+    """
+    if not _HAS_FALLOCATE:
+        return
+    try:
+        os.posix_fallocate(fd, 0, length)
+    except OSError as exc:
+        if exc.errno in (errno.ENOSPC, errno.EDQUOT):
+            raise
+
+
+def _trim_to_written(fd: int) -> None:
+    """Truncate *fd* to its current offset.
+
+    Drops any preallocated space past the data actually written, e.g.
+    when the body was shorter than ``Content-Length`` or the transfer
+    failed part-way.
+    """
+    with contextlib.suppress(OSError):
+        os.ftruncate(fd, os.lseek(fd, 0, os.SEEK_CUR))
+
+
+def _open_output(path: Path, offset: int) -> int:
+    """Open *path* for writing and return the raw descriptor.
+
+    With ``offset == 0`` the file is created or truncated.  Otherwise an
+    existing partial download is reopened, cut back to *offset* bytes,
+    and positioned to append the rest.
+    """
+    if not offset:
+        return os.open(path, _OPEN_FLAGS, 0o644)
+    fd = os.open(path, _RESUME_FLAGS)
+    try:
+        os.ftruncate(fd, offset)
+        os.lseek(fd, offset, os.SEEK_SET)
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+def _range_headers(offset: int) -> dict[str, str] | None:
+    """Return request headers asking for the body from *offset* onwards."""
+    return {"Range": f"bytes={offset}-"} if offset else None
+
+
+def _range_start(response: Any) -> int | None:
+    """Return the first byte offset of a 206 *response*'s ``Content-Range``.
+
+    ``None`` when the header is missing or not a ``bytes`` range.
+    """
+    unit, _, spec = str(response.headers.get("Content-Range", "")).partition(" ")
+    start = spec.partition("-")[0]
+    return int(start) if unit.lower() == "bytes" and start.isdigit() else None
+
+
+def _range_total(response: Any) -> int | None:
+    """Return the complete length from *response*'s ``Content-Range``.
+
+    A 416 reply carries ``bytes */<length>``; ``None`` when the header is
+    missing or the length is unknown (``*``).
+    """
+    unit, _, spec = str(response.headers.get("Content-Range", "")).partition(" ")
+    total = spec.rpartition("/")[2]
+    return int(total) if unit.lower() == "bytes" and total.isdigit() else None
+
 
+def _is_encoded(response: Any) -> bool:
+    """Return whether *response* has a ``Content-Encoding`` (e.g. gzip).
+
+    libcurl decodes such bodies, so the bytes on disk no longer line up
+    with the byte offsets a ``Range`` request would refer to.
+    """
+    encoding = response.headers.get("Content-Encoding")
+    return bool(encoding) and str(encoding).strip().lower() != "identity"
+
+
+def _discard_partial(path: Path, size: int) -> None:
+    """Remove a partial download left behind by failed resume attempts.
+
+    Otherwise the next run would treat the non-empty file as complete.
+    """
+    if size:
+        with contextlib.suppress(OSError):
+            path.unlink(missing_ok=True)
+
+
+def _write_all(fd: int, data: bytes | bytearray | memoryview) -> None:
+    """Write all of *data* to the raw descriptor *fd*.
+
+    ``os.write`` may perform a short write, so loop until the whole
+    buffer has been handed to the kernel.
+    """
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+class _WriteBatcher:
+    """Coalesce small network chunks into ``_CHUNK_SIZE`` writes to *fd*.
+
+    Chunks are copied into a fixed staging buffer and written out once it
+    is full, so a video arriving as thousands of small pieces costs one
+    ``write()`` syscall per 64 KiB instead of one per piece.  Chunks at
+    least as large as the buffer bypass it.  Call :meth:`flush` after the
+    last chunk.
+
+    The staging buffer *buf* is supplied by the caller so it can be
+    reused across downloads (see :meth:`MediaDownloader._acquire_buffer`).
+    """
+
+    __slots__ = ("_fd", "_buf", "_view", "_used")
+
+    def __init__(self, fd: int, buf: bytearray) -> None:
+        self._fd = fd
+        self._buf = buf
+        self._view = memoryview(buf)
+        self._used = 0
+
+    def write(self, data: bytes) -> None:
+        size = len(data)
+        if self._used + size > len(self._buf):
+            self.flush()
+            if size >= len(self._buf):
+                _write_all(self._fd, data)
+                return
+        self._view[self._used:self._used + size] = data
+        self._used += size
+
+    def flush(self) -> None:
+        if self._used:
+            _write_all(self._fd, self._view[:self._used])
+            self._used = 0
+
+
+def _backoff(attempt: int) -> float:
+    """Return the delay before retry *attempt* + 1.
+
+    Exponential, with +/-50% jitter so downloads that failed together do
+    not retry in lockstep.
+    """
+    return random.uniform(0.5, 1.5) * (2.0 ** attempt)
+
+
+class _Transfer:
+    """Per-file download state shared by the sync and async download paths.
+
+    Tracks the resume offset across retry attempts, owns the output
+    descriptor and write batching for the current attempt, and turns the
+    attempt's outcome into the ``(success, error, size, path)`` tuple.
+    :meth:`MediaDownloader._download_file` and
+    :meth:`MediaDownloader._download_file_async` only perform the network
+    I/O around it.
+
+    Per attempt: :meth:`begin` with the response, :meth:`write` each
+    chunk, :meth:`finish` after the last one, and always :meth:`close`.
+    """
+
+    __slots__ = (
+        "_downloader", "url", "local_path", "resume_from", "last_error",
+        "bytes_written", "_resumable", "_fd", "_buf", "_writer", "_expected",
+    )
+
+    def __init__(self, downloader: MediaDownloader, url: str, local_path: Path) -> None:
+        self._downloader = downloader
+        self.url = url
+        self.local_path = local_path
+        # Bytes of a previous attempt that reached disk.  A retry after a
+        # mid-transfer failure only requests the remainder.
+        self.resume_from = 0
+        # False once a response body arrived content-encoded: its partial
+        # file can only be replaced, not resumed.
+        self._resumable = True
+        self.last_error: str | None = None
+        self.bytes_written = 0
+        self._fd: int | None = None
+        self._buf: bytearray | None = None
+        self._writer: _WriteBatcher | None = None
+        self._expected = 0
+
+    def request_headers(self) -> dict[str, str] | None:
+        """Return the headers for the next GET (a ``Range`` when resuming)."""
+        return _range_headers(self.resume_from) if self._resumable else None
+
+    def begin(self, response: Any) -> None:
+        """Check *response* and open the output file for its body."""
+        response.raise_for_status()
+
+        # Resolve extension *after* the first response so we can use
+        # Content-Type.  If the extension changed, update the local_path
+        # accordingly.
+        offset = self.resume_from if self._resumable else 0
+        ext = self._downloader._resolve_extension(self.url, response)
+        if self.local_path.suffix != ext:
+            self.local_path = self.local_path.with_suffix(ext)
+            offset = 0
+
+        if response.status_code == 206 and offset:
+            # Only append a body that continues exactly where the file ends.
+            start = _range_start(response)
+            if start != offset:
+                self._resumable = False
+                raise ValueError(
+                    f"Content-Range starts at {start}, expected {offset}",
+                )
+        else:
+            # A server that ignored the Range header sends the whole body
+            # again (200 instead of 206): start over.
+            offset = 0
+        self.resume_from = offset
+        self._resumable = not _is_encoded(response)
+
+        # Write to an unbuffered descriptor, batching the small chunks
+        # libcurl delivers into 64 KiB writes.
+        self.bytes_written = self.resume_from
+        fd = self._fd = _open_output(self.local_path, self.resume_from)
+        self._buf = self._downloader._acquire_buffer()
+        self._writer = _WriteBatcher(fd, self._buf)
+        self._expected = _content_length(response)
+        if self._expected:
+            try:
+                _preallocate(fd, self.resume_from + self._expected)
+            except BaseException:
+                self.close()
+                raise
+
+    def write(self, chunk: bytes) -> None:
+        """Append one body chunk."""
+        if chunk:
+            assert self._writer is not None
+            self._writer.write(chunk)
+            self.bytes_written += len(chunk)
+
+    def finish(self) -> None:
+        """Flush the last chunks once the body has been read completely."""
+        assert self._writer is not None and self._fd is not None
+        self._writer.flush()
+        if self.bytes_written >= _DONTNEED_THRESHOLD:
+            _release_page_cache(self._fd)
+
+    def close(self) -> None:
+        """Close the output file, recording how much of it reached disk."""
+        fd = self._fd
+        if fd is None:
+            return
+        if self._expected:
+            _trim_to_written(fd)
+        self.resume_from = os.lseek(fd, 0, os.SEEK_CUR)
+        if self._buf is not None:
+            self._downloader._release_buffer(self._buf)
+        os.close(fd)
+        self._fd = self._buf = self._writer = None
+
+    def outcome(self) -> tuple[bool, str | None, int | None, Path | None] | None:
+        """Return the success result, or ``None`` to retry an empty body."""
+        if self.bytes_written == 0:
+            self.last_error = "Downloaded file is empty (0 bytes)"
+            logger.warning("Empty download for %s", self.url)
+            # Remove the empty file
+            with contextlib.suppress(Exception):
+                self.local_path.unlink(missing_ok=True)
+            return None
+        logger.debug("Downloaded %s (%d bytes)", self.local_path, self.bytes_written)
+        return True, None, self.bytes_written, self.local_path
+
+    def fail(self, exc: Exception, attempt: int) -> tuple[bool, str | None, int | None, Path | None] | None:
+        """Record a failed attempt; return the final result unless it is retryable.
+
+        A 416 to a resume request whose ``Content-Range`` length equals the
+        bytes on disk means the file is complete, so the success result is
+        returned.
+        """
+        response = getattr(exc, "response", None)
+        if self.resume_from and self._resumable and getattr(response, "status_code", None) == 416:
+            # 416 to "Range: bytes=<size>-": the previous attempt already
+            # wrote every byte, or the file changed.  Either accept the
+            # file or fall back to a plain GET -- never repeat the Range.
+            if _range_total(response) == self.resume_from:
+                self.bytes_written = self.resume_from
+                return self.outcome()
+            self._resumable = False
+        self.last_error, retryable = self._downloader._describe_failure(
+            exc, attempt, self.url, self.local_path,
+        )
+        return None if retryable else self.give_up()
+
+    def give_up(self) -> tuple[bool, str | None, int | None, Path | None]:
+        """Delete any partial file and return the failure result."""
+        _discard_partial(self.local_path, self.resume_from)
+        return False, self.last_error, None, None
+
+
+@functools.lru_cache(maxsize=8192)
 def detect_extension_from_url(url: str) -> str | None:
     """Detect a file extension from the URL path.
 
     Parses the URL to extract the path component, then checks for a
     recognisable extension.  Query strings, fragments, and CDN path
-    prefixes are handled correctly.
+    prefixes are handled correctly.  Results are cached per URL: each
+    download looks its URL up twice (initial filename and final
+    extension resolution).
 
     Args:
         url: The URL to inspect.
@@ -92,9 +456,13 @@ def detect_extension_from_url(url: str) -> str | None:
     return None
 
 
+@functools.lru_cache(maxsize=256)
 def detect_extension_from_content_type(content_type: str | None) -> str | None:
     """Map a Content-Type header value to a file extension.
 
+    CDNs only send a handful of distinct header values, so results are
+    cached.
+
     Args:
         content_type: The ``Content-Type`` header value (may include
             charset parameters, e.g. ``"image/jpeg; charset=utf-8"``).
@@ -106,7 +474,7 @@ def detect_extension_from_content_type(content_type: str | None) -> str | None:
     if not content_type:
         return None
     # Strip parameters (e.g. "; charset=utf-8")
-    mime = content_type.split(";")[0].strip().lower()
+    mime = content_type.partition(";")[0].strip().lower()
     return _CONTENT_TYPE_MAP.get(mime)
 
 
@@ -160,6 +528,8 @@ class MediaDownloader:
             When ``None`` a fresh session is created.
         timeout: Per-request timeout in seconds.
         max_retries: Maximum retry attempts for a single download.
+        max_concurrency: Maximum number of simultaneous downloads issued
+            by :meth:`download_ad_media_async`.
     """
 
     def __init__(
@@ -168,15 +538,69 @@ class MediaDownloader:
         session: CffiSession | None = None,
         timeout: int = 30,
         max_retries: int = 2,
+        max_concurrency: int = 16,
     ) -> None:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.session = session or CffiSession(impersonate="chrome")
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_concurrency = max(1, max_concurrency)
+        # Free list of _CHUNK_SIZE staging buffers.  A download borrows one
+        # for its lifetime, so sequential downloads share a single buffer and
+        # concurrent ones never hold more than max_concurrency.
+        self._buffers: list[bytearray] = []
+        # Exponentially decayed counts of download attempts and of those
+        # that were 403 (expired), used to decide whether a HEAD preflight
+        # is worth its round trip.
+        self._urls_attempted = 0.0
+        self._urls_expired = 0.0
 
     # ── Internal helpers ─────────────────────────────────────────────
 
+    def _acquire_buffer(self) -> bytearray:
+        """Borrow a staging buffer for :class:`_WriteBatcher`."""
+        try:
+            return self._buffers.pop()
+        except IndexError:
+            return bytearray(_CHUNK_SIZE)
+
+    def _release_buffer(self, buf: bytearray) -> None:
+        """Return *buf* to the free list."""
+        if len(self._buffers) < self.max_concurrency:
+            self._buffers.append(buf)
+
+    def _start_attempt(self) -> bool:
+        """Count a new download and return whether to HEAD-preflight it."""
+        preflight = self._should_preflight()
+        self._urls_attempted = self._urls_attempted * _PREFLIGHT_DECAY + 1
+        self._urls_expired *= _PREFLIGHT_DECAY
+        return preflight
+
+    def _should_preflight(self) -> bool:
+        """Return whether enough recent URLs expired to justify a HEAD first.
+
+        Both counts decay on every attempt (see :data:`_PREFLIGHT_DECAY`),
+        so the rate reflects roughly the last few dozen downloads.
+        """
+        attempted = self._urls_attempted
+        return (
+            attempted >= _PREFLIGHT_MIN_URLS
+            and self._urls_expired >= attempted * _PREFLIGHT_403_RATE
+        )
+
+    def _preflight_error(self, response: Any, url: str) -> str | None:
+        """Return the failure message if a HEAD *response* shows *url* expired.
+
+        Any other status (including servers that reject HEAD) lets the
+        GET proceed.
+        """
+        if response.status_code != 403:
+            return None
+        self._urls_expired += 1
+        logger.warning("URL likely expired (403 Forbidden on HEAD): %s", url)
+        return "HTTP 403: URL expired (HEAD preflight)"
+
     def _resolve_extension(self, url: str, response: Any = None) -> str:
         """Determine the file extension for a downloaded resource.
 
@@ -201,104 +625,265 @@ class MediaDownloader:
         """
         return f"{ad_id}_{creative_index}_{media_type}{ext}"
 
+    def _initial_path(self, ad_id: str, creative_index: int, media_type: str, url: str) -> Path:
+        """Return the download path for *url*, using its URL extension.
+
+        :meth:`_download_file` may still swap the suffix once the
+        response's Content-Type is known.
+        """
+        ext = detect_extension_from_url(url) or ".bin"
+        return self.output_dir / self._build_filename(ad_id, creative_index, media_type, ext)
+
     def _download_file(
         self,
         url: str,
         local_path: Path,
-    ) -> tuple[bool, str | None, int | None]:
+    ) -> tuple[bool, str | None, int | None, Path | None]:
         """Download a single file from *url* to *local_path*.
 
+        When many URLs have turned out to be expired, a HEAD request is
+        sent first so another expired URL fails without opening a stream.
+
         Returns:
-            A tuple of ``(success, error_message, file_size)``.  **Never
+            A tuple of ``(success, error_message, file_size, final_path)``.
+            ``final_path`` is where the file was written -- *local_path*
+            with its suffix replaced if the Content-Type called for a
+            different extension -- or ``None`` on failure.  **Never
             raises** -- all exceptions are caught and returned as error
             strings.
         """
-        # Skip if file already exists with non-zero size
-        try:
-            if local_path.exists() and local_path.stat().st_size > 0:
-                size = local_path.stat().st_size
-                logger.debug("Skipping existing file: %s (%d bytes)", local_path, size)
-                return True, None, size
-        except Exception as exc:
-            # Stat failures should not prevent a download attempt
-            logger.debug("Could not stat existing file %s: %s", local_path, exc)
+        existing = self._existing_size(local_path)
+        if existing is not None:
+            return True, None, existing, local_path
 
-        last_error: str | None = None
+        if self._start_attempt():
+            try:
+                head = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+            except Exception as exc:
+                logger.debug("HEAD preflight failed for %s: %s", url, exc)
+            else:
+                expired = self._preflight_error(head, url)
+                if expired:
+                    return False, expired, None, None
 
+        transfer = _Transfer(self, url, local_path)
         for attempt in range(self.max_retries):
             try:
                 response = self.session.get(
                     url, stream=True, timeout=self.timeout, allow_redirects=True,
+                    headers=transfer.request_headers(),
                 )
-                response.raise_for_status()
-
-                # Resolve extension *after* the first response so we can
-                # use Content-Type.  If the extension changed, update the
-                # local_path accordingly.
-                ext = self._resolve_extension(url, response)
-                if local_path.suffix != ext:
-                    local_path = local_path.with_suffix(ext)
-
-                bytes_written = 0
-                with open(local_path, "wb") as fh:
-                    for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
-                        if chunk:
-                            fh.write(chunk)
-                            bytes_written += len(chunk)
-
-                if bytes_written == 0:
-                    last_error = "Downloaded file is empty (0 bytes)"
-                    logger.warning("Empty download for %s", url)
-                    # Remove the empty file
-                    with contextlib.suppress(Exception):
-                        local_path.unlink(missing_ok=True)
-                    continue
-
-                logger.debug("Downloaded %s (%d bytes)", local_path, bytes_written)
-                return True, None, bytes_written
-
-            except CffiHTTPError as exc:
-                status = getattr(exc, "response", None)
-                status = getattr(status, "status_code", None) if status else None
-                last_error = f"HTTP {status}: {exc}"
-                if status == 403:
-                    logger.warning("URL likely expired (403 Forbidden): %s", url)
-                    # No point retrying an expired token
-                    return False, last_error, None
-                logger.warning(
-                    "HTTP error on attempt %d/%d for %s: %s",
-                    attempt + 1, self.max_retries, url, exc,
-                )
-            except CffiConnectionError as exc:
-                last_error = f"Connection error: {exc}"
-                logger.warning(
-                    "Connection error on attempt %d/%d for %s: %s",
-                    attempt + 1, self.max_retries, url, exc,
-                )
-            except CffiTimeout as exc:
-                last_error = f"Timeout: {exc}"
-                logger.warning(
-                    "Timeout on attempt %d/%d for %s: %s",
-                    attempt + 1, self.max_retries, url, exc,
-                )
-            except OSError as exc:
-                last_error = f"IO error: {exc}"
-                logger.warning("IO error writing %s: %s", local_path, exc)
-                # IO errors are unlikely to resolve with retries
-                return False, last_error, None
+                transfer.begin(response)
+                try:
+                    for chunk in response.iter_content():
+                        transfer.write(chunk)
+                    transfer.finish()
+                finally:
+                    transfer.close()
+                outcome = transfer.outcome()
+                if outcome is not None:
+                    return outcome
+                # Empty body: retry straight away.
+                continue
             except Exception as exc:
-                last_error = f"Unexpected error: {exc}"
-                logger.warning(
-                    "Unexpected error on attempt %d/%d for %s: %s",
-                    attempt + 1, self.max_retries, url, exc,
+                outcome = transfer.fail(exc, attempt)
+                if outcome is not None:
+                    return outcome
+
+            if attempt < self.max_retries - 1:
+                time.sleep(_backoff(attempt))
+
+        return transfer.give_up()
+
+    async def _download_file_async(
+        self,
+        session: CffiAsyncSession,
+        url: str,
+        local_path: Path,
+    ) -> tuple[bool, str | None, int | None, Path | None]:
+        """Async counterpart of :meth:`_download_file` using *session*.
+
+        Same skip, retry, and error semantics -- both drive a
+        :class:`_Transfer` -- but backoff uses :func:`asyncio.sleep` so
+        other downloads proceed meanwhile.  **Never raises.**
+        """
+        existing = self._existing_size(local_path)
+        if existing is not None:
+            return True, None, existing, local_path
+
+        if self._start_attempt():
+            try:
+                head = await session.head(url, timeout=self.timeout, allow_redirects=True)
+            except Exception as exc:
+                logger.debug("HEAD preflight failed for %s: %s", url, exc)
+            else:
+                expired = self._preflight_error(head, url)
+                if expired:
+                    return False, expired, None, None
+
+        transfer = _Transfer(self, url, local_path)
+        for attempt in range(self.max_retries):
+            try:
+                response = await session.get(
+                    url, stream=True, timeout=self.timeout, allow_redirects=True,
+                    headers=transfer.request_headers(),
                 )
+                try:
+                    transfer.begin(response)
+                    try:
+                        async for chunk in response.aiter_content():
+                            transfer.write(chunk)
+                        transfer.finish()
+                    finally:
+                        transfer.close()
+                finally:
+                    await response.aclose()
+                outcome = transfer.outcome()
+                if outcome is not None:
+                    return outcome
+                continue
+            except Exception as exc:
+                outcome = transfer.fail(exc, attempt)
+                if outcome is not None:
+                    return outcome
 
-            # Exponential backoff between retries
             if attempt < self.max_retries - 1:
-                backoff = 1.0 * (2 ** attempt)
-                time.sleep(backoff)
+                await asyncio.sleep(_backoff(attempt))
 
-        return False, last_error, None
+        return transfer.give_up()
+
+    def _temporary_async_session(self) -> CffiAsyncSession:
+        """Create an async session with the proxies, cookies and headers of :attr:`session`.
+
+        Keeps async downloads on the same proxy and identity as sync ones.
+        """
+        source = self.session
+        return CffiAsyncSession(
+            impersonate="chrome",
+            max_clients=self.max_concurrency,
+            proxies=source.proxies,
+            cookies=source.cookies,
+            headers=source.headers,
+        )
+
+    def _existing_size(self, local_path: Path) -> int | None:
+        """Return the size of an already-downloaded *local_path*, if any.
+
+        Files that exist with non-zero size are not downloaded again.
+        """
+        try:
+            if local_path.exists() and local_path.stat().st_size > 0:
+                size = local_path.stat().st_size
+                logger.debug("Skipping existing file: %s (%d bytes)", local_path, size)
+                return size
+        except Exception as exc:
+            # Stat failures should not prevent a download attempt
+            logger.debug("Could not stat existing file %s: %s", local_path, exc)
+        return None
+
+    def _describe_failure(
+        self,
+        exc: Exception,
+        attempt: int,
+        url: str,
+        local_path: Path,
+    ) -> tuple[str, bool]:
+        """Log a failed download attempt and classify it.
+
+        Returns:
+            A tuple of ``(error_message, retryable)``.
+        """
+        if isinstance(exc, CffiHTTPError):
+            status = getattr(exc, "response", None)
+            status = getattr(status, "status_code", None) if status else None
+            if status == 403:
+                self._urls_expired += 1
+                logger.warning("URL likely expired (403 Forbidden): %s", url)
+                # No point retrying an expired token
+                return f"HTTP {status}: {exc}", False
+            logger.warning(
+                "HTTP error on attempt %d/%d for %s: %s",
+                attempt + 1, self.max_retries, url, exc,
+            )
+            return f"HTTP {status}: {exc}", True
+        if isinstance(exc, CffiConnectionError):
+            logger.warning(
+                "Connection error on attempt %d/%d for %s: %s",
+                attempt + 1, self.max_retries, url, exc,
+            )
+            return f"Connection error: {exc}", True
+        if isinstance(exc, CffiTimeout):
+            logger.warning(
+                "Timeout on attempt %d/%d for %s: %s",
+                attempt + 1, self.max_retries, url, exc,
+            )
+            return f"Timeout: {exc}", True
+        if isinstance(exc, OSError):
+            logger.warning("IO error writing %s: %s", local_path, exc)
+            # IO errors are unlikely to resolve with retries
+            return f"IO error: {exc}", False
+        logger.warning(
+            "Unexpected error on attempt %d/%d for %s: %s",
+            attempt + 1, self.max_retries, url, exc,
+        )
+        return f"Unexpected error: {exc}", True
+
+    def _iter_media(self, ad: Ad) -> Iterator[tuple[int, str, str]]:
+        """Yield ``(creative_index, media_type, url)`` for every media URL of *ad*."""
+        for idx, creative in enumerate(ad.creatives):
+            for getter, media_type in _MEDIA_GETTERS:
+                url = getter(creative)
+                if url:
+                    yield idx, media_type, url
+
+    def _processing_failure(
+        self,
+        ad: Ad,
+        creative_index: int,
+        media_type: str,
+        url: str,
+        exc: BaseException,
+    ) -> MediaDownloadResult:
+        """Log and wrap an unexpected error raised while handling one URL."""
+        logger.warning(
+            "Failed to process media %s for ad %s creative %d: %s",
+            media_type, ad.id, creative_index, exc,
+        )
+        return MediaDownloadResult(
+            ad_id=ad.id,
+            creative_index=creative_index,
+            media_type=media_type,
+            url=url,
+            success=False,
+            error=f"Processing error: {exc}",
+        )
+
+    def _reuse_download(
+        self,
+        result: MediaDownloadResult,
+        creative_index: int,
+        media_type: str,
+    ) -> MediaDownloadResult:
+        """Derive the result for a URL that already appeared earlier in the ad.
+
+        Ads often repeat a URL across fields (image and thumbnail) or
+        creatives.  Instead of downloading it again, the existing file is
+        hard-linked under this slot's filename; if linking is not possible
+        the result points at the original file.
+        """
+        local_path = result.local_path
+        if result.success and local_path:
+            source = Path(local_path)
+            target = source.with_name(
+                self._build_filename(result.ad_id, creative_index, media_type, source.suffix),
+            )
+            try:
+                if not target.exists():
+                    os.link(source, target)
+                local_path = str(target)
+            except OSError as exc:
+                logger.debug("Could not link %s to %s: %s", source, target, exc)
+        return replace(result, creative_index=creative_index, media_type=media_type, local_path=local_path)
 
     # ── Public API ───────────────────────────────────────────────────
 
@@ -318,57 +903,112 @@ class MediaDownloader:
             included.  **Never raises.**
         """
         results: list[MediaDownloadResult] = []
+        seen: dict[str, MediaDownloadResult] = {}
 
         try:
-            for idx, creative in enumerate(ad.creatives):
-                for field_name, media_type in _MEDIA_FIELDS:
-                    url = getattr(creative, field_name, None)
-                    if not url:
+            for idx, media_type, url in self._iter_media(ad):
+                try:
+                    if url in seen:
+                        results.append(self._reuse_download(seen[url], idx, media_type))
                         continue
 
-                    try:
-                        # Pre-resolve extension from URL for the initial filename
-                        ext = detect_extension_from_url(url) or ".bin"
-                        filename = self._build_filename(ad.id, idx, media_type, ext)
-                        local_path = self.output_dir / filename
-
-                        success, error, file_size = self._download_file(url, local_path)
-
-                        # The actual local_path may have changed extension
-                        # after Content-Type resolution.  Check what exists.
-                        actual_path: str | None = None
-                        if success:
-                            # Find the file (extension may have changed)
-                            pattern = f"{ad.id}_{idx}_{media_type}.*"
-                            matches = list(self.output_dir.glob(pattern))
-                            actual_path = str(matches[0]) if matches else str(local_path)
-
-                        results.append(MediaDownloadResult(
-                            ad_id=ad.id,
-                            creative_index=idx,
-                            media_type=media_type,
-                            url=url,
-                            local_path=actual_path,
-                            success=success,
-                            error=error,
-                            file_size=file_size,
-                        ))
-
-                    except Exception as exc:
-                        logger.warning(
-                            "Failed to process media %s for ad %s creative %d: %s",
-                            media_type, ad.id, idx, exc,
-                        )
-                        results.append(MediaDownloadResult(
-                            ad_id=ad.id,
-                            creative_index=idx,
-                            media_type=media_type,
-                            url=url,
-                            success=False,
-                            error=f"Processing error: {exc}",
-                        ))
+                    local_path = self._initial_path(ad.id, idx, media_type, url)
+                    success, error, file_size, final_path = self._download_file(url, local_path)
+
+                    result = MediaDownloadResult(
+                        ad_id=ad.id,
+                        creative_index=idx,
+                        media_type=media_type,
+                        url=url,
+                        local_path=str(final_path) if final_path else None,
+                        success=success,
+                        error=error,
+                        file_size=file_size,
+                    )
+                    seen[url] = result
+                    results.append(result)
+
+                except Exception as exc:
+                    results.append(self._processing_failure(ad, idx, media_type, url, exc))
 
         except Exception as exc:
             logger.warning("Failed to iterate creatives for ad %s: %s", ad.id, exc)
 
         return results
+
+    async def download_ad_media_async(
+        self,
+        ad: Ad,
+        session: CffiAsyncSession | None = None,
+    ) -> list[MediaDownloadResult]:
+        """Download all media of an ad concurrently.
+
+        Behaves like :meth:`download_ad_media` but issues the downloads in
+        parallel (at most ``max_concurrency`` at a time), so the wall time
+        is bounded by the slowest file rather than the sum of all of them.
+        Results are returned in the same order as the sequential method.
+
+        Args:
+            ad: An :class:`~meta_ads_collector.models.Ad` instance.
+            session: An optional ``curl_cffi`` :class:`AsyncSession` to
+                reuse.  When ``None`` a temporary session sharing the
+                proxies, cookies and headers of :attr:`session` is created
+                and closed before returning.
+
+        Returns:
+            A list of :class:`MediaDownloadResult` objects.  **Never
+            raises.**
+        """
+        try:
+            targets = list(self._iter_media(ad))
+        except Exception as exc:
+            logger.warning("Failed to iterate creatives for ad %s: %s", ad.id, exc)
+            return []
+        if not targets:
+            return []
+
+        own_session = session is None
+        client = session or self._temporary_async_session()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _download(idx: int, media_type: str, url: str) -> MediaDownloadResult:
+            local_path = self._initial_path(ad.id, idx, media_type, url)
+            async with semaphore:
+                success, error, file_size, final_path = await self._download_file_async(client, url, local_path)
+            return MediaDownloadResult(
+                ad_id=ad.id,
+                creative_index=idx,
+                media_type=media_type,
+                url=url,
+                local_path=str(final_path) if final_path else None,
+                success=success,
+                error=error,
+                file_size=file_size,
+            )
+
+        # Each distinct URL is downloaded once; repeats reuse its result.
+        first_targets: dict[str, tuple[int, str]] = {}
+        for idx, media_type, url in targets:
+            first_targets.setdefault(url, (idx, media_type))
+
+        try:
+            outcomes = await asyncio.gather(
+                *(_download(idx, media_type, url) for url, (idx, media_type) in first_targets.items()),
+                return_exceptions=True,
+            )
+        finally:
+            if own_session:
+                with contextlib.suppress(Exception):
+                    await client.close()
+
+        by_url = dict(zip(first_targets, outcomes))
+        results: list[MediaDownloadResult] = []
+        for idx, media_type, url in targets:
+            outcome = by_url[url]
+            if not isinstance(outcome, MediaDownloadResult):
+                results.append(self._processing_failure(ad, idx, media_type, url, outcome))
+            elif first_targets[url] == (idx, media_type):
+                results.append(outcome)
+            else:
+                results.append(self._reuse_download(outcome, idx, media_type))
+        return results
@@ -4,59 +4,202 @@ from __future__ import annotations
 
 import json
 import re as _re
-from dataclasses import asdict, dataclass, field
+import sys
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache, partial
+from itertools import islice, zip_longest
 from typing import Any
 
+# ``slots=True`` (no per-instance ``__dict__``: smaller objects, faster
+# attribute access) needs Python 3.10; older interpreters get plain
+# dataclasses.
+_DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-def _parse_spend_string(text: str) -> tuple[int | None, int | None]:
-    """Parse a spend string like '$9K-$10K' into (lower, upper) ints."""
-    multipliers = {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
-    parts = _re.findall(r'[\d,.]+[KMB]?', text)
+# Number tokens in spend/impression strings, e.g. "9K", "1,000", "2.5M".
+_RANGE_TOKEN_RE = _re.compile(r'([\d,.]+)([KMB]?)', _re.ASCII)
+_MULTIPLIERS: dict[str, int] = {"": 1, "K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
+
+
+def _parse_range(text: str, single_is_exact: bool) -> tuple[int | None, int | None]:
+    """Parse the first two numbers of *text* into (lower, upper) ints.
+
+    A lone number becomes ``(n, n)`` when *single_is_exact* is true and
+    ``(n, None)`` (an open-ended ``">n"`` range) otherwise.
+    """
     values: list[int] = []
-    for part in parts:
-        suffix = part[-1].upper() if part[-1].upper() in multipliers else ""
-        num_str = part[:-1] if suffix else part
-        num_str = num_str.replace(",", "")
-        try:
-            num = float(num_str)
-            if suffix:
-                num *= multipliers[suffix]
-            values.append(int(num))
-        except ValueError:
+    for num_str, suffix in _RANGE_TOKEN_RE.findall(text):
+        # Fixed-point integer arithmetic: "1.15M" is 115 * 10**6 // 10**2,
+        # which avoids float rounding (int(1.15 * 1e6) == 1149999).
+        whole, _, frac = num_str.replace(",", "").partition(".")
+        digits = whole + frac
+        if not digits.isdigit():  # stray "," / "." or a second "."
             continue
+        values.append(int(digits) * _MULTIPLIERS[suffix] // 10 ** len(frac))
     if len(values) >= 2:
         return values[0], values[1]
     if len(values) == 1:
-        return values[0], values[0]
+        return values[0], values[0] if single_is_exact else None
     return None, None
 
 
+def _parse_spend_string(text: str) -> tuple[int | None, int | None]:
+    """Parse a spend string like '$9K-$10K' into (lower, upper) ints."""
+    return _parse_range(text, single_is_exact=True)
+
+
 def _parse_impression_text(text: str) -> tuple[int | None, int | None]:
     """Parse an impression text like '>1M' or '1K-5K' into (lower, upper)."""
-    multipliers = {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
-    parts = _re.findall(r'[\d,.]+[KMB]?', text)
-    values: list[int] = []
-    for part in parts:
-        suffix = part[-1].upper() if part[-1].upper() in multipliers else ""
-        num_str = part[:-1] if suffix else part
-        num_str = num_str.replace(",", "")
-        try:
-            num = float(num_str)
-            if suffix:
-                num *= multipliers[suffix]
-            values.append(int(num))
-        except ValueError:
-            continue
-    if len(values) >= 2:
-        return values[0], values[1]
-    if len(values) == 1:
-        # ">1M" means lower=1M, upper=None
-        return values[0], None
-    return None, None
+    # ">1M" means lower=1M, upper=None
+    return _parse_range(text, single_is_exact=False)
+
+
+# Canonical field -> the keys it appears under in the different GraphQL
+# response formats (snake_case, camelCase, legacy names), in priority order.
+_FIELD_ALIASES: dict[str, tuple[str, ...]] = {
+    "id": ("id", "adArchiveID", "ad_archive_id"),
+    "ad_library_id": ("adLibraryID", "ad_library_id"),
+    "page": ("page", "pageInfo"),
+    "ad_status": ("ad_status", "adStatus"),
+    "is_active": ("is_active", "isActive"),
+    "start_time": ("ad_delivery_start_time", "startDate", "start_date"),
+    "stop_time": ("ad_delivery_stop_time", "endDate", "end_date"),
+    "ad_creative_bodies": ("ad_creative_bodies", "adCreativeBodies"),
+    "ad_creative_link_captions": ("ad_creative_link_captions", "adCreativeLinkCaptions"),
+    "ad_creative_link_descriptions": ("ad_creative_link_descriptions", "adCreativeLinkDescriptions"),
+    "ad_creative_link_titles": ("ad_creative_link_titles", "adCreativeLinkTitles"),
+    "snapshot_url": ("snapshot_url", "snapshotUrl"),
+    "ad_snapshot_url": ("ad_snapshot_url", "adSnapshotUrl"),
+    "impressions": ("impressions", "impressionsWithIndex", "impressions_with_index"),
+    "impressions_text": ("impressions_text", "impressionsText"),
+    "spend": ("spend", "spendWithIndex"),
+    "reach": ("reach", "reach_estimate"),
+    "lower_bound": ("lower_bound", "lowerBound"),
+    "upper_bound": ("upper_bound", "upperBound"),
+    "demographic_distribution": ("demographic_distribution", "demographicDistribution"),
+    "delivery_by_region": ("delivery_by_region", "deliveryByRegion"),
+    "publisher_platforms": ("publisher_platforms", "publisherPlatforms", "publisher_platform"),
+    "funding_entity": ("funding_entity", "fundingEntity"),
+    "ad_type": ("ad_type", "adType"),
+    "beneficiary_payers": ("beneficiary_payers", "beneficiaryPayers"),
+    "collation_id": ("collation_id", "collationID"),
+    "collation_count": ("collation_count", "collationCount"),
+}
+
+
+def _first(data: dict[str, Any], name: str) -> Any:
+    """Return the first truthy value stored under any alias of *name*.
+
+    Equivalent to ``data.get(a) or data.get(b) or ...`` over the keys in
+    :data:`_FIELD_ALIASES`: when no alias holds a truthy value, the last
+    alias's value is returned, so a falsy ``0`` or ``False`` there is kept.
+    """
+    value = None
+    for key in _FIELD_ALIASES[name]:
+        value = data.get(key)
+        if value:
+            return value
+    return value
+
+
+def _from_iso(text: str) -> datetime:
+    """Parse an ISO 8601 string, accepting a trailing ``Z`` or ``+HHMM``.
+
+    :meth:`datetime.fromisoformat` only understands ``Z`` and offsets
+    without a colon (Meta's ``2024-01-15T10:30:00+0000`` shape) from
+    Python 3.11, so both are rewritten to ``+HH:MM`` first.  Parsing itself
+    stays in C rather than slicing fields out in Python.
+    """
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    elif len(text) > 19 and text[-5] in "+-" and text[-3] != ":":
+        text = f"{text[:-2]}:{text[-2:]}"
+    return datetime.fromisoformat(text)
+
+
+# The API sends delivery dates as epoch seconds or ISO strings; dispatch on
+# the exact type with one dict lookup.  Datetimes (payloads built by hand or
+# re-parsed from an existing Ad) pass through.  Anything else is tried as a
+# string.
+_DATE_PARSERS: dict[type, Callable[[Any], datetime]] = {
+    int: datetime.fromtimestamp,
+    str: _from_iso,
+    datetime: lambda value: value,
+}
+
+
+def _parse_datetime(value: Any) -> datetime | None:
+    """Parse an API timestamp (epoch seconds or ISO 8601 string).
+
+    Returns ``None`` for values that cannot be parsed.
+    """
+    try:
+        parser = _DATE_PARSERS.get(type(value))
+        if parser is None:
+            return _from_iso(str(value))
+        return parser(value)
+    except (ValueError, TypeError, OverflowError, OSError):
+        return None
+
+
+# ``datetime.now(timezone.utc)`` bound once; called from C with no
+# Python-level frame, unlike a lambda.
+_utcnow = partial(datetime.now, timezone.utc)
+
+
+@lru_cache(maxsize=4096)
+def _cached_isoformat(value: datetime, tzinfo: Any, fold: int) -> str:
+    return value.isoformat()
+
+
+def _isoformat(value: datetime) -> str:
+    """Return ``value.isoformat()``, memoised.
+
+    Delivery dates repeat across the ads of a crawl and exporters may call
+    :meth:`Ad.to_dict` more than once per ad, so the formatted strings are
+    cached.  ``tzinfo`` is part of the key because aware datetimes for the
+    same instant compare equal even when their offsets (and therefore
+    their ISO strings) differ.  So is ``fold``: equality and hashing
+    ignore it, yet the two readings of an ambiguous DST hour under a
+    ``zoneinfo`` zone have different offsets.
+    """
+    return _cached_isoformat(value, value.tzinfo, value.fold)
+
+
+def _intern(value: Any) -> Any:
+    """Intern *value* if it is a string; anything else is returned as-is.
+
+    Used for values repeated across ads (page id and name, funding
+    entity, platforms, languages, categories, currency, status,
+    distribution categories) so a large crawl holds one copy of each
+    instead of one per ad, and equality checks during filtering and
+    aggregation short-circuit on identity.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_all(values: Any) -> Any:
+    """Apply :func:`_intern` to each item of a list; non-lists pass through."""
+    return [_intern(v) for v in values] if type(values) is list else values
+
+
+# Shared encoder for single-line output.  json.dumps() constructs a fresh
+# JSONEncoder on every call once a non-default option such as
+# ``ensure_ascii=False`` is passed, which JSONL exports pay per ad.
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 
+# ``body`` is either ``{"text": "..."}`` (live API) or a plain string
+# (legacy payloads).  Decoded JSON never produces subclasses of either, so
+# an exact-type lookup replaces the chain of isinstance checks.
+_BODY_EXTRACTORS: dict[type, Callable[[Any], str | None]] = {
+    dict: lambda value: value.get("text"),
+    str: lambda value: value,
+}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class SpendRange:
     """Represents ad spend range"""
     lower_bound: int | None = None
@@ -64,34 +207,36 @@ class SpendRange:
     currency: str | None = None
 
     def __str__(self) -> str:
-        if self.lower_bound is not None and self.upper_bound is not None:
-            return f"{self.currency} {self.lower_bound:,} - {self.upper_bound:,}"
-        return "N/A"
+        lower, upper = self.lower_bound, self.upper_bound
+        if lower is None or upper is None:
+            return "N/A"
+        return f"{self.currency} {lower:,} - {upper:,}"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ImpressionRange:
     """Represents impression count range"""
     lower_bound: int | None = None
     upper_bound: int | None = None
 
     def __str__(self) -> str:
-        if self.lower_bound is not None and self.upper_bound is not None:
-            return f"{self.lower_bound:,} - {self.upper_bound:,}"
-        return "N/A"
+        lower, upper = self.lower_bound, self.upper_bound
+        if lower is None or upper is None:
+            return "N/A"
+        return f"{lower:,} - {upper:,}"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AudienceDistribution:
     """Demographic or geographic distribution data"""
     category: str
     percentage: float
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {"category": self.category, "percentage": self.percentage}
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AdCreative:
     """Ad creative content - text, media, links"""
     body: str | None = None
@@ -108,10 +253,37 @@ class AdCreative:
     cta_type: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        return {k: v for k, v in asdict(self).items() if v is not None}
-
-
-@dataclass
+        # Straight-line checks: creatives are serialised for every ad, and
+        # this avoids building a full dict only to filter it again.
+        data: dict[str, Any] = {}
+        if self.body is not None:
+            data["body"] = self.body
+        if self.caption is not None:
+            data["caption"] = self.caption
+        if self.description is not None:
+            data["description"] = self.description
+        if self.title is not None:
+            data["title"] = self.title
+        if self.link_url is not None:
+            data["link_url"] = self.link_url
+        if self.image_url is not None:
+            data["image_url"] = self.image_url
+        if self.video_url is not None:
+            data["video_url"] = self.video_url
+        if self.video_hd_url is not None:
+            data["video_hd_url"] = self.video_hd_url
+        if self.video_sd_url is not None:
+            data["video_sd_url"] = self.video_sd_url
+        if self.thumbnail_url is not None:
+            data["thumbnail_url"] = self.thumbnail_url
+        if self.cta_text is not None:
+            data["cta_text"] = self.cta_text
+        if self.cta_type is not None:
+            data["cta_type"] = self.cta_type
+        return data
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class PageInfo:
     """Information about the page running the ad"""
     id: str
@@ -122,10 +294,17 @@ class PageInfo:
     verified: bool = False
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "name": self.name,
+            "profile_picture_url": self.profile_picture_url,
+            "page_url": self.page_url,
+            "likes": self.likes,
+            "verified": self.verified,
+        }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PageSearchResult:
     """Result from a typeahead page search in the Ad Library.
 
@@ -143,10 +322,19 @@ class PageSearchResult:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            "page_id": self.page_id,
+            "page_name": self.page_name,
+            "page_profile_uri": self.page_profile_uri,
+            "page_alias": self.page_alias,
+            "page_logo_url": self.page_logo_url,
+            "page_verified": self.page_verified,
+            "page_like_count": self.page_like_count,
+            "category": self.category,
+        }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TargetingInfo:
     """Ad targeting information"""
     age_min: int | None = None
@@ -158,10 +346,26 @@ class TargetingInfo:
     excluded_locations: list[str] = field(default_factory=list)
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        # Lists are copied so callers cannot mutate the model through the dict.
+        return {
+            "age_min": self.age_min,
+            "age_max": self.age_max,
+            "genders": list(self.genders),
+            "locations": list(self.locations),
+            "location_types": list(self.location_types),
+            "interests": list(self.interests),
+            "excluded_locations": list(self.excluded_locations),
+        }
+
+
+def _range_dict(value: ImpressionRange | None) -> dict[str, int | None] | None:
+    """Serialise an impression/reach range for :meth:`Ad.to_dict`."""
+    if value is None:
+        return None
+    return {"lower_bound": value.lower_bound, "upper_bound": value.upper_bound}
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Ad:
     """
     Complete Meta Ad schema with all available fields from Ad Library.
@@ -231,43 +435,55 @@ class Ad:
     raw_data: dict[str, Any] | None = field(default=None, repr=False)
 
     # Collection metadata
-    collected_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    collected_at: datetime = field(default_factory=_utcnow)
     collection_source: str = "meta_ads_library"
 
-    def to_dict(self, include_raw: bool = False) -> dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
+    def to_dict(self, include_raw: bool = False, omit_empty: bool = False) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization
+
+        Args:
+            include_raw: Include the raw GraphQL payload under ``raw_data``.
+            omit_empty: Drop keys whose value is ``None`` or an empty list,
+                for more compact JSON output.
+        """
+        page = self.page
+        targeting = self.targeting
+        start = self.delivery_start_time
+        stop = self.delivery_stop_time
+        spend = self.spend
+        audience_lower = self.estimated_audience_size_lower
         result = {
             "id": self.id,
             "ad_library_id": self.ad_library_id,
-            "page": self.page.to_dict() if self.page else None,
+            "page": page.to_dict() if page is not None else None,
             "is_active": self.is_active,
             "ad_status": self.ad_status,
-            "delivery_start_time": self.delivery_start_time.isoformat() if self.delivery_start_time else None,
-            "delivery_stop_time": self.delivery_stop_time.isoformat() if self.delivery_stop_time else None,
+            "delivery_start_time": _isoformat(start) if start is not None else None,
+            "delivery_stop_time": _isoformat(stop) if stop is not None else None,
             "creatives": [c.to_dict() for c in self.creatives],
             "snapshot_url": self.snapshot_url,
             "ad_snapshot_url": self.ad_snapshot_url,
-            "impressions": {
-                "lower_bound": self.impressions.lower_bound,
-                "upper_bound": self.impressions.upper_bound,
-            } if self.impressions else None,
+            "impressions": _range_dict(self.impressions),
             "spend": {
-                "lower_bound": self.spend.lower_bound,
-                "upper_bound": self.spend.upper_bound,
-                "currency": self.spend.currency,
-            } if self.spend else None,
-            "reach": {
-                "lower_bound": self.reach.lower_bound,
-                "upper_bound": self.reach.upper_bound,
-            } if self.reach else None,
+                "lower_bound": spend.lower_bound,
+                "upper_bound": spend.upper_bound,
+                "currency": spend.currency,
+            } if spend is not None else None,
+            "reach": _range_dict(self.reach),
             "currency": self.currency,
-            "age_gender_distribution": [d.to_dict() for d in self.age_gender_distribution],
-            "region_distribution": [d.to_dict() for d in self.region_distribution],
-            "targeting": self.targeting.to_dict() if self.targeting else None,
+            "age_gender_distribution": [
+                {"category": d.category, "percentage": d.percentage}
+                for d in self.age_gender_distribution
+            ],
+            "region_distribution": [
+                {"category": d.category, "percentage": d.percentage}
+                for d in self.region_distribution
+            ],
+            "targeting": targeting.to_dict() if targeting is not None else None,
             "estimated_audience_size": {
-                "lower_bound": self.estimated_audience_size_lower,
+                "lower_bound": audience_lower,
                 "upper_bound": self.estimated_audience_size_upper,
-            } if self.estimated_audience_size_lower else None,
+            } if audience_lower else None,
             "publisher_platforms": self.publisher_platforms,
             "languages": self.languages,
             "bylines": self.bylines,
@@ -282,27 +498,37 @@ class Ad:
             "collection_source": self.collection_source,
         }
 
+        if omit_empty:
+            result = {k: v for k, v in result.items() if v is not None and v != []}
+
         if include_raw and self.raw_data:
             result["raw_data"] = self.raw_data
 
         return result
 
-    def to_json(self, include_raw: bool = False, indent: int = 2) -> str:
-        """Convert to JSON string"""
-        return json.dumps(self.to_dict(include_raw=include_raw), indent=indent, ensure_ascii=False)
+    def to_json(self, include_raw: bool = False, indent: int | None = 2) -> str:
+        """Convert to JSON string.
+
+        ``indent=None`` gives compact single-line output, as used for
+        JSON Lines exports.
+        """
+        data = self.to_dict(include_raw=include_raw)
+        if indent is None:
+            return _COMPACT_ENCODER.encode(data)
+        return json.dumps(data, indent=indent, ensure_ascii=False)
 
     @classmethod
     def _parse_reach(cls, data: dict[str, Any]) -> ImpressionRange | None:
         """Parse reach data from various API formats."""
-        reach_data = data.get("reach") or data.get("reach_estimate") or {}
+        reach_data = _first(data, "reach") or {}
         if not reach_data:
             return None
         if isinstance(reach_data, str):
             lower, upper = _parse_impression_text(reach_data)
             return ImpressionRange(lower_bound=lower, upper_bound=upper)
         if isinstance(reach_data, dict):
-            lower = reach_data.get("lower_bound") or reach_data.get("lowerBound")
-            upper = reach_data.get("upper_bound") or reach_data.get("upperBound")
+            lower = _first(reach_data, "lower_bound")
+            upper = _first(reach_data, "upper_bound")
             if lower is None and upper is None:
                 return None
             return ImpressionRange(lower_bound=lower, upper_bound=upper)
@@ -321,16 +547,16 @@ class Ad:
         Returns:
             The body text string, or ``None`` if not available.
         """
-        if body_value is None:
-            return None
-        if isinstance(body_value, dict):
-            return body_value.get("text")
-        if isinstance(body_value, str):
-            return body_value
-        return None
+        extract = _BODY_EXTRACTORS.get(type(body_value))
+        return extract(body_value) if extract is not None else None
 
     @classmethod
-    def from_graphql_response(cls, data: dict[str, Any]) -> Ad:
+    def from_graphql_response(
+        cls,
+        data: dict[str, Any],
+        keep_raw: bool = True,
+        collected_at: datetime | None = None,
+    ) -> Ad:
         """
         Parse an ad from the Meta Ad Library GraphQL response.
 
@@ -344,25 +570,31 @@ class Ad:
         3. **Legacy format**: ``ad_creative_bodies``,
            ``ad_creative_link_titles``, etc. arrays with optional
            ``snapshot.cards`` for media.
+
+        With ``keep_raw=False`` the payload is not retained on
+        :attr:`raw_data`, so it can be garbage-collected once parsing is
+        done.  The media filters fall back to ``raw_data`` when no
+        creative-level media was parsed, and ``to_dict(include_raw=True)``
+        has nothing to export, so only drop it when neither is needed.
+
+        ``collected_at`` defaults to the current UTC time.
         """
         # ── Extract page info ───────────────────────────────────────
         # Can be in a nested ``page`` object or flat fields at top level
-        page_data = data.get("page") or data.get("pageInfo") or {}
+        page_data = _first(data, "page") or {}
         if page_data:
+            picture = page_data.get("profile_picture")
             page = PageInfo(
-                id=page_data.get("id", ""),
-                name=page_data.get("name", ""),
-                profile_picture_url=(
-                    page_data.get("profile_picture", {}).get("uri")
-                    if page_data.get("profile_picture") else None
-                ),
+                id=_intern(page_data.get("id", "")),
+                name=_intern(page_data.get("name", "")),
+                profile_picture_url=picture.get("uri") if picture else None,
                 page_url=page_data.get("url"),
             )
         else:
             # Flat structure from live API search results
             page = PageInfo(
-                id=data.get("page_id", ""),
-                name=data.get("page_name", ""),
+                id=_intern(data.get("page_id", "")),
+                name=_intern(data.get("page_name", "")),
                 profile_picture_url=data.get("page_profile_picture_url"),
                 page_url=data.get("page_profile_uri"),
                 likes=data.get("page_like_count"),
@@ -437,195 +669,189 @@ class Ad:
                 creatives.append(creative)
             else:
                 # ── Legacy fallback: ad_creative_bodies arrays ──────
-                bodies = data.get("ad_creative_bodies") or data.get("adCreativeBodies") or []
-                link_captions = (
-                    data.get("ad_creative_link_captions")
-                    or data.get("adCreativeLinkCaptions") or []
+                bodies = _first(data, "ad_creative_bodies") or []
+                link_captions = _first(data, "ad_creative_link_captions") or []
+                link_descriptions = _first(data, "ad_creative_link_descriptions") or []
+                link_titles = _first(data, "ad_creative_link_titles") or []
+
+                # One creative per body/title (at least one); captions and
+                # descriptions only fill in alongside them.
+                count = max(len(bodies), len(link_titles), 1)
+                rows = zip_longest(bodies, link_captions, link_descriptions, link_titles)
+                creatives.extend(
+                    AdCreative(body=body, caption=caption, description=description, title=title)
+                    for body, caption, description, title in islice(rows, count)
                 )
-                link_descriptions = (
-                    data.get("ad_creative_link_descriptions")
-                    or data.get("adCreativeLinkDescriptions") or []
-                )
-                link_titles = (
-                    data.get("ad_creative_link_titles")
-                    or data.get("adCreativeLinkTitles") or []
-                )
-
-                max_creatives = max(len(bodies), len(link_titles), 1)
-                for i in range(max_creatives):
-                    creative = AdCreative(
-                        body=bodies[i] if i < len(bodies) else None,
-                        caption=link_captions[i] if i < len(link_captions) else None,
-                        description=link_descriptions[i] if i < len(link_descriptions) else None,
-                        title=link_titles[i] if i < len(link_titles) else None,
-                    )
-                    creatives.append(creative)
+                if not creatives:
+                    creatives.append(AdCreative())
 
                 # Parse snapshot/display images for legacy format
                 snapshot = data.get("snapshot") or {}
                 if snapshot:
-                    for i, creative in enumerate(creatives):
-                        snap_cards = snapshot.get("cards") or []
-                        if i < len(snap_cards):
-                            card = snap_cards[i]
-                            creative.image_url = (
-                                card.get("resized_image_url")
-                                or card.get("original_image_url")
-                            )
-                            creative.video_url = (
-                                card.get("video_hd_url")
-                                or card.get("video_sd_url")
-                            )
-                            creative.video_hd_url = card.get("video_hd_url")
-                            creative.video_sd_url = card.get("video_sd_url")
-                            creative.link_url = card.get("link_url")
-                            creative.cta_text = card.get("cta_text")
-                            creative.cta_type = card.get("cta_type")
+                    snap_cards = snapshot.get("cards") or []
+                    for creative, card in zip(creatives, snap_cards):
+                        creative.image_url = (
+                            card.get("resized_image_url")
+                            or card.get("original_image_url")
+                        )
+                        creative.video_url = (
+                            card.get("video_hd_url")
+                            or card.get("video_sd_url")
+                        )
+                        creative.video_hd_url = card.get("video_hd_url")
+                        creative.video_sd_url = card.get("video_sd_url")
+                        creative.link_url = card.get("link_url")
+                        creative.cta_text = card.get("cta_text")
+                        creative.cta_type = card.get("cta_type")
 
         # Parse dates
-        delivery_start = None
-        delivery_stop = None
-        start_time = data.get("ad_delivery_start_time") or data.get("startDate") or data.get("start_date")
-        stop_time = data.get("ad_delivery_stop_time") or data.get("endDate") or data.get("end_date")
-
-        if start_time:
-            try:
-                if isinstance(start_time, int):
-                    delivery_start = datetime.fromtimestamp(start_time)
-                else:
-                    delivery_start = datetime.fromisoformat(str(start_time).replace("Z", "+00:00"))
-            except (ValueError, TypeError):
-                pass
-
-        if stop_time:
-            try:
-                if isinstance(stop_time, int):
-                    delivery_stop = datetime.fromtimestamp(stop_time)
-                else:
-                    delivery_stop = datetime.fromisoformat(str(stop_time).replace("Z", "+00:00"))
-            except (ValueError, TypeError):
-                pass
+        start_time = _first(data, "start_time")
+        stop_time = _first(data, "stop_time")
+        delivery_start = _parse_datetime(start_time) if start_time else None
+        delivery_stop = _parse_datetime(stop_time) if stop_time else None
 
         # Parse impressions
         impressions = None
-        imp_data = (
-            data.get("impressions")
-            or data.get("impressionsWithIndex")
-            or data.get("impressions_with_index")
-            or {}
-        )
+        imp_data = _first(data, "impressions") or {}
         if imp_data:
             if isinstance(imp_data, str):
                 lower, upper = _parse_impression_text(imp_data)
                 impressions = ImpressionRange(lower_bound=lower, upper_bound=upper)
             elif isinstance(imp_data, dict):
                 # Standard format: {lower_bound, upper_bound}
-                lower = imp_data.get("lower_bound") or imp_data.get("lowerBound")
-                upper = imp_data.get("upper_bound") or imp_data.get("upperBound")
+                lower = _first(imp_data, "lower_bound")
+                upper = _first(imp_data, "upper_bound")
                 # Alternative format: {impressions_text, impressions_index}
                 if lower is None and upper is None:
-                    imp_text = imp_data.get("impressions_text") or imp_data.get("impressionsText")
+                    imp_text = _first(imp_data, "impressions_text")
                     if imp_text:
                         lower, upper = _parse_impression_text(str(imp_text))
                 impressions = ImpressionRange(lower_bound=lower, upper_bound=upper)
 
         # Parse spend
+        currency = _intern(data.get("currency"))
         spend = None
-        spend_data = data.get("spend") or data.get("spendWithIndex") or {}
+        spend_data = _first(data, "spend") or {}
         if spend_data:
             if isinstance(spend_data, str):
                 lower, upper = _parse_spend_string(spend_data)
                 spend = SpendRange(
                     lower_bound=lower,
                     upper_bound=upper,
-                    currency=data.get("currency"),
+                    currency=currency,
                 )
             elif isinstance(spend_data, dict):
                 spend = SpendRange(
-                    lower_bound=spend_data.get("lower_bound") or spend_data.get("lowerBound"),
-                    upper_bound=spend_data.get("upper_bound") or spend_data.get("upperBound"),
-                    currency=data.get("currency"),
+                    lower_bound=_first(spend_data, "lower_bound"),
+                    upper_bound=_first(spend_data, "upper_bound"),
+                    currency=currency,
+                )
+
+        # Parse demographic and region distributions.  These can run to
+        # dozens of points per ad and the API sends lists of dicts, so the
+        # first pass skips the per-item type check; only if an entry turns
+        # out not to be a dict is the list re-parsed with the check.
+        demo_data = _first(data, "demographic_distribution") or []
+        try:
+            age_gender_dist = [
+                AudienceDistribution(
+                    _intern(f"{item.get('age', 'unknown')}_{item.get('gender', 'unknown')}"),
+                    float(item.get("percentage", 0)),
+                )
+                for item in demo_data
+            ]
+        except AttributeError:
+            age_gender_dist = [
+                AudienceDistribution(
+                    _intern(f"{item.get('age', 'unknown')}_{item.get('gender', 'unknown')}"),
+                    float(item.get("percentage", 0)),
                 )
+                for item in demo_data
+                if isinstance(item, dict)
+            ]
 
-        # Parse demographic distribution
-        age_gender_dist = []
-        demo_data = data.get("demographic_distribution") or data.get("demographicDistribution") or []
-        for item in demo_data:
-            if not isinstance(item, dict):
-                continue
-            age_gender_dist.append(AudienceDistribution(
-                category=f"{item.get('age', 'unknown')}_{item.get('gender', 'unknown')}",
-                percentage=float(item.get("percentage", 0)),
-            ))
-
-        # Parse region distribution
-        region_dist = []
-        region_data = data.get("delivery_by_region") or data.get("deliveryByRegion") or []
-        for item in region_data:
-            if not isinstance(item, dict):
-                continue
-            region_dist.append(AudienceDistribution(
-                category=item.get("region", "unknown"),
-                percentage=float(item.get("percentage", 0)),
-            ))
+        region_data = _first(data, "delivery_by_region") or []
+        try:
+            region_dist = [
+                AudienceDistribution(
+                    _intern(item.get("region", "unknown")), float(item.get("percentage", 0)),
+                )
+                for item in region_data
+            ]
+        except AttributeError:
+            region_dist = [
+                AudienceDistribution(
+                    _intern(item.get("region", "unknown")), float(item.get("percentage", 0)),
+                )
+                for item in region_data
+                if isinstance(item, dict)
+            ]
 
         # Parse publisher platforms (API uses both singular and plural keys)
-        platforms = (
-            data.get("publisher_platforms")
-            or data.get("publisherPlatforms")
-            or data.get("publisher_platform")
-            or []
-        )
+        platforms = _first(data, "publisher_platforms") or []
         if isinstance(platforms, str):
             platforms = [platforms]
+        platforms = _intern_all(platforms)
 
         # Determine active status - None when field isn't present in data
-        is_active = data.get("is_active") or data.get("isActive")
-        if is_active is None:
-            ad_status_val = data.get("ad_status") or data.get("adStatus")
-            if ad_status_val:
-                is_active = ad_status_val == "ACTIVE"
+        ad_status = _intern(_first(data, "ad_status"))
+        is_active = _first(data, "is_active")
+        if is_active is None and ad_status:
+            is_active = ad_status == "ACTIVE"
+
+        audience = data.get("estimated_audience_size")
+        if not isinstance(audience, dict):
+            audience = {}
 
         return cls(
-            id=str(data.get("id") or data.get("adArchiveID") or data.get("ad_archive_id", "")),
-            ad_library_id=data.get("adLibraryID") or data.get("ad_library_id"),
+            id=str(_first(data, "id") or ""),
+            ad_library_id=_first(data, "ad_library_id"),
             page=page,
             is_active=is_active,
-            ad_status=data.get("ad_status") or data.get("adStatus"),
+            ad_status=ad_status,
             delivery_start_time=delivery_start,
             delivery_stop_time=delivery_stop,
             creatives=creatives,
-            snapshot_url=data.get("snapshot_url") or data.get("snapshotUrl"),
-            ad_snapshot_url=data.get("ad_snapshot_url") or data.get("adSnapshotUrl"),
+            snapshot_url=_first(data, "snapshot_url"),
+            ad_snapshot_url=_first(data, "ad_snapshot_url"),
             impressions=impressions,
             spend=spend,
             reach=cls._parse_reach(data),
-            currency=data.get("currency"),
+            currency=currency,
             age_gender_distribution=age_gender_dist,
             region_distribution=region_dist,
-            estimated_audience_size_lower=(
-                data.get("estimated_audience_size", {}).get("lower_bound")
-                if isinstance(data.get("estimated_audience_size"), dict) else None
-            ),
-            estimated_audience_size_upper=(
-                data.get("estimated_audience_size", {}).get("upper_bound")
-                if isinstance(data.get("estimated_audience_size"), dict) else None
-            ),
+            estimated_audience_size_lower=audience.get("lower_bound"),
+            estimated_audience_size_upper=audience.get("upper_bound"),
             publisher_platforms=platforms,
-            languages=data.get("languages") or [],
+            languages=_intern_all(data.get("languages") or []),
             bylines=data.get("bylines") or [],
-            funding_entity=data.get("funding_entity") or data.get("fundingEntity"),
+            funding_entity=_intern(_first(data, "funding_entity")),
             disclaimer=data.get("disclaimer"),
-            ad_type=data.get("ad_type") or data.get("adType"),
-            categories=data.get("categories") or page_categories,
-            beneficiary_payers=data.get("beneficiary_payers") or data.get("beneficiaryPayers") or [],
-            collation_id=data.get("collation_id") or data.get("collationID"),
-            collation_count=data.get("collation_count") or data.get("collationCount"),
-            raw_data=data,
+            ad_type=_intern(_first(data, "ad_type")),
+            categories=_intern_all(data.get("categories") or page_categories),
+            beneficiary_payers=_first(data, "beneficiary_payers") or [],
+            collation_id=_first(data, "collation_id"),
+            collation_count=_first(data, "collation_count"),
+            raw_data=data if keep_raw else None,
+            collected_at=collected_at if collected_at is not None else _utcnow(),
         )
 
+    @classmethod
+    def from_graphql_responses(
+        cls, items: Iterable[dict[str, Any]], keep_raw: bool = True,
+    ) -> list[Ad]:
+        """Parse a batch of ads, e.g. one page of GraphQL search results.
+
+        A convenience over calling :meth:`from_graphql_response` on each
+        item, except that all ads share one ``collected_at`` timestamp.
+        Unlike the collector's streaming loop this raises on the first
+        malformed item.
+        """
+        collected_at = _utcnow()
+        return [cls.from_graphql_response(item, keep_raw, collected_at) for item in items]
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SearchResult:
     """Represents a paginated search result from the Ad Library"""
     ads: list[Ad]
@@ -642,3 +868,17 @@ class SearchResult:
             "end_cursor": self.end_cursor,
             "search_id": self.search_id,
         }
+
+    def to_json(self, indent: int | None = 2) -> str:
+        """Convert to JSON string"""
+        # The ads are handed to the encoder as-is and converted through
+        # ``default`` as it reaches them, so each ad's dict can be freed
+        # once written instead of the whole page's dicts being built first.
+        payload = {
+            "ads": self.ads,
+            "total_count": self.total_count,
+            "has_next_page": self.has_next_page,
+            "end_cursor": self.end_cursor,
+            "search_id": self.search_id,
+        }
+        return json.dumps(payload, indent=indent, ensure_ascii=False, default=Ad.to_dict)
@@ -7,6 +7,7 @@ automatic dead-proxy exclusion, and cooldown-based recovery.
 
 import logging
 import time
+from collections import deque
 
 from .exceptions import ProxyError
 
@@ -39,12 +40,12 @@ def parse_proxy(proxy_string: str) -> str:
     if "://" in stripped:
         return stripped
 
-    parts = stripped.split(":")
-    if len(parts) == 2:
-        host, port = parts
-        return f"http://{host}:{port}"
-    elif len(parts) == 4:
-        host, port, user, password = parts
+    colons = stripped.count(":")
+    if colons == 1:
+        # ``host:port`` is already in URL authority form.
+        return f"http://{stripped}"
+    elif colons == 3:
+        host, port, user, password = stripped.split(":")
         return f"http://{user}:{password}@{host}:{port}"
     else:
         raise ProxyError(
@@ -80,16 +81,18 @@ class ProxyPool:
         self.cooldown = cooldown
 
         # Normalize all proxy strings
-        self._proxies: list[str] = []
-        for p in proxies:
-            self._proxies.append(parse_proxy(p))
+        self._proxies: list[str] = [parse_proxy(p) for p in proxies]
 
         # Per-proxy state
         self._failures: dict[str, int] = {p: 0 for p in self._proxies}
+        # Proxy -> time.monotonic() when it was marked dead.  Monotonic so
+        # wall-clock adjustments cannot shorten or extend a cooldown.
         self._dead_since: dict[str, float] = {}
 
-        # Round-robin index
-        self._index = 0
+        # Round-robin order.  Dead proxies stay in the rotation and are
+        # skipped lazily when they reach the front, so picking the next
+        # proxy never scans the whole pool.
+        self._rotation: deque[str] = deque(self._proxies)
 
         logger.debug("ProxyPool initialized with %d proxies", len(self._proxies))
 
@@ -126,7 +129,7 @@ class ProxyPool:
     def alive_proxies(self) -> list[str]:
         """Return the list of proxies that are currently alive or have
         passed their cooldown period."""
-        now = time.time()
+        now = time.monotonic()
         alive: list[str] = []
         for proxy in self._proxies:
             if proxy not in self._dead_since:
@@ -148,17 +151,19 @@ class ProxyPool:
             ProxyError: If all proxies are dead and none have passed
                 their cooldown.
         """
-        alive = self.alive_proxies
-        if not alive:
-            raise ProxyError(
-                "All proxies are dead. Reset the pool or wait for "
-                "cooldown to expire."
-            )
-
-        # Wrap the index around alive list length
-        proxy = alive[self._index % len(alive)]
-        self._index = (self._index + 1) % len(alive)
-        return proxy
+        now = time.monotonic()
+        rotation = self._rotation
+        for _ in range(len(rotation)):
+            proxy = rotation[0]
+            rotation.rotate(-1)
+            dead_since = self._dead_since.get(proxy)
+            if dead_since is None or now - dead_since >= self.cooldown:
+                return proxy
+
+        raise ProxyError(
+            "All proxies are dead. Reset the pool or wait for "
+            "cooldown to expire."
+        )
 
     def mark_success(self, proxy: str) -> None:
         """Record a successful request through the given proxy.
@@ -189,14 +194,14 @@ class ProxyPool:
             "Proxy failure %d/%d: %s", count, self.max_failures, proxy
         )
         if count >= self.max_failures and proxy not in self._dead_since:
-            self._dead_since[proxy] = time.time()
+            self._dead_since[proxy] = time.monotonic()
             logger.warning("Proxy marked as dead: %s", proxy)
 
     def reset(self) -> None:
         """Reset all failure counters and revive all dead proxies."""
         self._failures = {p: 0 for p in self._proxies}
         self._dead_since.clear()
-        self._index = 0
+        self._rotation = deque(self._proxies)
         logger.info("ProxyPool reset: all proxies revived")
 
     def get_proxy_dict(self, proxy_url: str) -> dict[str, str]:
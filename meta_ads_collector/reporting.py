@@ -25,11 +25,15 @@ Usage::
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass
+import sys
+from dataclasses import dataclass
 from datetime import datetime
 
+# ``slots=True`` needs Python 3.10; older interpreters get a plain dataclass.
+_DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class CollectionReport:
     """Summary statistics from a collection run.
 
@@ -52,6 +56,11 @@ class CollectionReport:
     end_time: datetime | None = None
 
 
+def _iso(value: datetime | None) -> str | None:
+    """Return *value* as an ISO 8601 string, or ``None``."""
+    return value.isoformat() if value is not None else None
+
+
 def format_report(report: CollectionReport) -> str:
     """Format a :class:`CollectionReport` as a human-readable summary.
 
@@ -77,9 +86,9 @@ def format_report(report: CollectionReport) -> str:
         lines.append(f"  Throughput:         {throughput:.2f} ads/s")
 
     if report.start_time is not None:
-        lines.append(f"  Start time:         {report.start_time.isoformat()}")
+        lines.append(f"  Start time:         {_iso(report.start_time)}")
     if report.end_time is not None:
-        lines.append(f"  End time:           {report.end_time.isoformat()}")
+        lines.append(f"  End time:           {_iso(report.end_time)}")
 
     lines.append("=" * 50)
     return "\n".join(lines)
@@ -94,10 +103,15 @@ def format_report_json(report: CollectionReport) -> str:
     Returns:
         A JSON string with all report fields.
     """
-    data = asdict(report)
-    # Convert datetime objects to ISO strings for JSON serialization
-    if data.get("start_time") is not None:
-        data["start_time"] = data["start_time"].isoformat()
-    if data.get("end_time") is not None:
-        data["end_time"] = data["end_time"].isoformat()
+    # CollectionReport is flat, so build the dict directly rather than via
+    # asdict()'s recursive copy.
+    data = {
+        "total_collected": report.total_collected,
+        "duplicates_skipped": report.duplicates_skipped,
+        "filtered_out": report.filtered_out,
+        "errors": report.errors,
+        "duration_seconds": report.duration_seconds,
+        "start_time": _iso(report.start_time),
+        "end_time": _iso(report.end_time),
+    }
     return json.dumps(data, indent=2, ensure_ascii=False)
@@ -5,8 +5,9 @@ including Ad Library URLs, profile URLs, and vanity URLs.
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional
-from urllib.parse import ParseResult, parse_qs, urlparse
+from urllib.parse import ParseResult, unquote_plus, urlparse
 
 logger = logging.getLogger(__name__)
 
@@ -22,12 +23,37 @@ _FACEBOOK_HOSTS = frozenset({
 })
 
 
+# Canonical page URL prefixes; ``<prefix><digits>[/]`` is resolved without
+# running the general URL parser.
+_FAST_PREFIXES = tuple(
+    f"{scheme}{host}/"
+    for scheme in ("https://", "http://")
+    for host in ("www.facebook.com", "facebook.com", "m.facebook.com")
+)
+
+
 def _is_facebook_url(parsed: ParseResult) -> bool:
     """Return True if the parsed URL belongs to a known Facebook hostname."""
     host = parsed.hostname or ""
     return host in _FACEBOOK_HOSTS
 
 
+def _query_value(query: str, key: str) -> Optional[str]:
+    """Return the first non-empty value of *key* in a query string.
+
+    Equivalent to ``parse_qs(query).get(key, [None])[0]`` for the single
+    key needed, without decoding and collecting every other parameter.
+    """
+    prefix = key + "="
+    for token in query.split("&"):
+        if token.startswith(prefix) and len(token) > len(prefix):
+            value = token[len(prefix):]
+            if "%" in value or "+" in value:
+                value = unquote_plus(value)
+            return value
+    return None
+
+
 def extract_page_id_from_url(url: str) -> Optional[str]:
     """Extract a numeric page ID from a Facebook URL.
 
@@ -69,10 +95,35 @@ def extract_page_id_from_url(url: str) -> Optional[str]:
     if url.isdigit():
         return url
 
+    return _extract_cached(url)
+
+
+@lru_cache(maxsize=4096)
+def _extract_cached(url: str) -> Optional[str]:
+    """Resolve a stripped, non-numeric *url* to a page ID.
+
+    Memoised because collection runs resolve the same page URLs over and
+    over; use ``extract_page_id_from_url.cache_clear()`` to reset.
+    """
+    # Fast path: canonical numeric page URLs, e.g. facebook.com/123456/
+    if url.startswith(_FAST_PREFIXES):
+        # The host ends at the first "/" after the scheme's "//".
+        tail = url[url.index("/", 8) + 1:]
+        if tail.endswith("/"):
+            tail = tail[:-1]
+        if len(tail) >= 5 and tail.isdigit():
+            return tail
+
     # Ensure URL has a scheme so urlparse works correctly
     if not url.startswith(("http://", "https://")):
         url = "https://" + url
 
+    # Every accepted host contains "facebook.com"; reject anything else
+    # without parsing.  Lowercased because urlparse's hostname is.
+    if "facebook.com" not in url.lower():
+        logger.debug("Not a Facebook URL: %s", url)
+        return None
+
     try:
         parsed = urlparse(url)
     except Exception:
@@ -84,21 +135,26 @@ def extract_page_id_from_url(url: str) -> Optional[str]:
         return None
 
     # Strategy 1: Check query parameters for explicit page IDs
-    query_params = parse_qs(parsed.query)
-
-    # Ad Library URLs: view_all_page_id=123456
-    view_all = query_params.get("view_all_page_id", [None])[0]
-    if view_all and view_all.isdigit():
-        return view_all
-
-    # Profile URLs: id=123456
-    profile_id = query_params.get("id", [None])[0]
-    if profile_id and profile_id.isdigit():
-        return profile_id
+    query = parsed.query
+    if query:
+        # Ad Library URLs: view_all_page_id=123456
+        view_all = _query_value(query, "view_all_page_id")
+        if view_all and view_all.isdigit():
+            return view_all
+
+        # Profile URLs: id=123456
+        profile_id = _query_value(query, "id")
+        if profile_id and profile_id.isdigit():
+            return profile_id
 
     # Strategy 2: Check the URL path for a numeric page ID
     path = parsed.path.strip("/")
 
+    # Common case: the last segment is the ID -- no need to split the path.
+    last = path[path.rfind("/") + 1:]
+    if len(last) >= 5 and last.isdigit():
+        return last
+
     # Remove common path prefixes
     # e.g., /ads/library/ -> ignore, we already checked query params
     # /pages/category/PageName/123456 -> extract trailing numeric
@@ -125,3 +181,6 @@ def extract_page_id_from_url(url: str) -> Optional[str]:
 
     # Could not determine page ID
     return None
+
+
+extract_page_id_from_url.cache_clear = _extract_cached.cache_clear  # type: ignore[attr-defined]
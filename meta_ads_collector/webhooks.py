@@ -7,10 +7,15 @@ external HTTP endpoint.  Designed for use as an event callback with the
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Callable
 
+from curl_cffi.requests import AsyncSession as CffiAsyncSession
 from curl_cffi.requests import Session as CffiSession
 
 from .events import AD_COLLECTED, Event
@@ -51,6 +56,22 @@ class WebhookSender:
         self.timeout = timeout
         self._buffer: list[dict[str, Any]] = []
         self._session: Any = CffiSession(impersonate="chrome")
+        # Created on first use so that sync-only senders never need a loop.
+        self._async_session: Any = None
+        # Payloads queued by the async callback, drained by at most
+        # _max_pending tasks so a large collection never floods the
+        # endpoint.  The set holds strong references to those tasks; the
+        # event loop only keeps weak ones.
+        self._async_queue: deque[dict[str, Any]] = deque()
+        self._tasks: set[asyncio.Task[bool]] = set()
+        # Full batches from the sync callback are sent on a single worker
+        # thread, so the event emitter does not wait for the HTTP round trip.
+        self._executor: ThreadPoolExecutor | None = None
+        # The curl_cffi session is not thread-safe: every sync POST holds
+        # this lock, so a direct send() on the caller's thread never
+        # overlaps a batch POST on the worker thread.
+        self._session_lock = threading.Lock()
+        self._pending: deque[Future[bool]] = deque()
 
     def send(self, data: dict[str, Any]) -> bool:
         """POST a single JSON payload to the webhook URL.
@@ -65,7 +86,52 @@ class WebhookSender:
         """
         for attempt in range(self.retries):
             try:
-                response = self._session.post(
+                with self._session_lock:
+                    response = self._session.post(
+                        self.url,
+                        json=data,
+                        timeout=self.timeout,
+                    )
+                if response.ok:
+                    logger.debug("Webhook POST succeeded: %s", response.status_code)
+                    return True
+                logger.warning(
+                    "Webhook POST returned %d (attempt %d/%d)",
+                    response.status_code,
+                    attempt + 1,
+                    self.retries,
+                )
+            except Exception:
+                logger.warning(
+                    "Webhook POST failed (attempt %d/%d)",
+                    attempt + 1,
+                    self.retries,
+                    exc_info=True,
+                )
+            # Exponential backoff before retry
+            if attempt < self.retries - 1:
+                time.sleep(0.1 * (2 ** attempt))
+
+        return False
+
+    async def send_async(self, data: dict[str, Any]) -> bool:
+        """Asynchronous version of :meth:`send`.
+
+        Uses a ``curl_cffi`` :class:`~curl_cffi.requests.AsyncSession` and
+        ``asyncio.sleep`` for the backoff, so waiting on a slow endpoint
+        never blocks the event loop.  **Never raises.**
+
+        Args:
+            data: The JSON-serializable dict to send.
+
+        Returns:
+            Whether the POST succeeded.
+        """
+        if self._async_session is None:
+            self._async_session = CffiAsyncSession(impersonate="chrome")
+        for attempt in range(self.retries):
+            try:
+                response = await self._async_session.post(
                     self.url,
                     json=data,
                     timeout=self.timeout,
@@ -88,7 +154,7 @@ class WebhookSender:
                 )
             # Exponential backoff before retry
             if attempt < self.retries - 1:
-                time.sleep(0.1 * (2 ** attempt))
+                await asyncio.sleep(0.1 * (2 ** attempt))
 
         return False
 
@@ -108,24 +174,58 @@ class WebhookSender:
         """
         return self.send({"ads": items, "count": len(items)})
 
+    # Batches allowed in flight on the worker thread before the callback
+    # waits for the oldest one, bounding memory when the endpoint is slow.
+    # Also the number of concurrent POSTs from the async callback.
+    _max_pending = 4
+
+    def _submit_batch(self, items: list[dict[str, Any]]) -> None:
+        """Queue *items* for :meth:`send_batch` on the background thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="webhook",
+            )
+        pending = self._pending
+        while pending and pending[0].done():
+            pending.popleft()
+        if len(pending) >= self._max_pending:
+            pending.popleft().result()
+        pending.append(self._executor.submit(self.send_batch, items))
+
     def flush(self) -> bool:
         """Send any buffered ads immediately.
 
+        Also waits for batches already handed to the background thread.
+
         Returns:
-            Whether the flush succeeded (or ``True`` if buffer was empty).
+            Whether the flush succeeded (or ``True`` if there was nothing
+            to send).
         """
-        if not self._buffer:
-            return True
-        items = list(self._buffer)
-        self._buffer.clear()
-        return self.send_batch(items)
+        if self._buffer:
+            items = list(self._buffer)
+            self._buffer.clear()
+            if self._executor is None:
+                return self.send_batch(items)
+            self._submit_batch(items)
+        ok = True
+        while self._pending:
+            ok = self._pending.popleft().result() and ok
+        return ok
+
+    def close(self) -> None:
+        """Flush buffered ads and stop the background send thread."""
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
     def as_callback(self) -> Callable[[Event], None]:
         """Return a callback function suitable for :meth:`EventEmitter.on`.
 
         The callback extracts ad data from ``ad_collected`` events and
         sends it to the webhook.  When *batch_size* > 1, ads are buffered
-        and sent in batches.
+        and each full batch is sent on a background thread; call
+        :meth:`flush` or :meth:`close` to send the remainder and wait.
 
         Returns:
             A callable ``(Event) -> None``.
@@ -143,6 +243,70 @@ class WebhookSender:
             else:
                 self._buffer.append(ad_dict)
                 if len(self._buffer) >= self.batch_size:
-                    self.flush()
+                    items = list(self._buffer)
+                    self._buffer.clear()
+                    self._submit_batch(items)
+
+        return _callback
+
+    def as_async_callback(self) -> Callable[[Event], None]:
+        """Return a callback that sends ads without blocking the event loop.
+
+        Intended for :class:`~meta_ads_collector.async_collector.AsyncMetaAdsCollector`,
+        whose events are emitted from inside a running loop.  Each ad (or
+        batch, when *batch_size* > 1) is queued and sent with
+        :meth:`send_async` by background tasks, at most four at a time.
+        Await :meth:`aclose` to deliver any remaining ads.
+
+        Returns:
+            A callable ``(Event) -> None``.
+        """
+        def _callback(event: Event) -> None:
+            if event.event_type != AD_COLLECTED:
+                return
+            ad = event.data.get("ad")
+            if ad is None:
+                return
+            ad_dict = ad.to_dict() if hasattr(ad, "to_dict") else dict(ad)
+
+            if self.batch_size <= 1:
+                self._schedule(ad_dict)
+            else:
+                self._buffer.append(ad_dict)
+                if len(self._buffer) >= self.batch_size:
+                    items = list(self._buffer)
+                    self._buffer.clear()
+                    self._schedule({"ads": items, "count": len(items)})
 
         return _callback
+
+    def _schedule(self, data: dict[str, Any]) -> None:
+        """Queue *data* and start a sending task if fewer than the limit run."""
+        self._async_queue.append(data)
+        # A task that has just emptied the queue is already done() even
+        # though its discard callback has not run yet.
+        if sum(not task.done() for task in self._tasks) < self._max_pending:
+            task = asyncio.get_running_loop().create_task(self._drain_async_queue())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _drain_async_queue(self) -> bool:
+        """Send queued payloads until the queue is empty."""
+        ok = True
+        while self._async_queue:
+            ok = await self.send_async(self._async_queue.popleft()) and ok
+        return ok
+
+    async def aclose(self) -> None:
+        """Send buffered ads, wait for scheduled sends and close the async session."""
+        if self._buffer:
+            items = list(self._buffer)
+            self._buffer.clear()
+            self._schedule({"ads": items, "count": len(items)})
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+        if self._async_queue:
+            await self._drain_async_queue()
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
@@ -13,6 +13,7 @@ are automatically skipped.
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 from typing import Any
@@ -43,6 +44,12 @@ def pytest_addoption(parser: Any) -> None:
         default=False,
         help="Run integration tests that hit real Meta API servers.",
     )
+    parser.addoption(
+        "--refresh-ads",
+        action="store_true",
+        default=False,
+        help="Re-collect the cached ads behind the collected_ads fixture.",
+    )
 
 
 def pytest_collection_modifyitems(config: Any, items: list[Any]) -> None:
@@ -85,15 +92,36 @@ def real_client():
 
 
 @pytest.fixture(scope="session")
-def collected_ads() -> list[Ad]:
+def collected_ads(request: Any) -> list[Ad]:
     """Session-scoped fixture: 10-20 real ads from a 'coca cola' search.
 
     Collected once per test session and shared across all tests that
     need real Ad objects (export tests, stats tests, etc.).  This
     avoids redundant API calls.
+
+    The raw GraphQL payloads are also stored in the pytest cache
+    (``.pytest_cache``) and re-parsed on later runs, so only the first
+    run hits the network.  Pass ``--refresh-ads`` to collect afresh.
     """
     from meta_ads_collector.collector import MetaAdsCollector
 
+    cache = getattr(request.config, "cache", None)
+    cache_file = cache.mkdir("meta_ads") / "collected_ads.json" if cache is not None else None
+    if (
+        cache_file is not None
+        and cache_file.exists()
+        and not request.config.getoption("--refresh-ads", default=False)
+    ):
+        try:
+            cached = Ad.from_graphql_responses(
+                json.loads(cache_file.read_text(encoding="utf-8"))
+            )
+        except Exception as exc:
+            logger.warning("Ignoring unreadable ad cache %s: %s", cache_file, exc)
+        else:
+            if cached:
+                return cached
+
     collector = MetaAdsCollector(rate_limit_delay=1.0, jitter=0.5, timeout=45)
     ads: list[Ad] = []
     try:
@@ -117,6 +145,12 @@ def collected_ads() -> list[Ad]:
             "Network may be unavailable or API may have changed."
         )
 
+    if cache_file is not None and all(ad.raw_data for ad in ads):
+        cache_file.write_text(
+            json.dumps([ad.raw_data for ad in ads], ensure_ascii=False),
+            encoding="utf-8",
+        )
+
     return ads
 
 
@@ -1,8 +1,10 @@
 """Tests for meta_ads_collector.client (unit tests, no network)."""
 
+import json
+
 import pytest
 
-from meta_ads_collector.client import MetaAdsClient
+from meta_ads_collector.client import MetaAdsClient, _loads_response
 from meta_ads_collector.exceptions import ProxyError
 
 
@@ -114,3 +116,29 @@ class TestRequestIdEncoding:
         client = MetaAdsClient.__new__(MetaAdsClient)
         assert client._encode_request_id(36) == "10"
         assert client._encode_request_id(10) == "a"
+
+
+class TestLoadsResponse:
+    def test_strips_xssi_prefix(self):
+        assert _loads_response('for (;;);{"data": {"a": 1}}') == {"data": {"a": 1}}
+
+    def test_plain_json(self):
+        assert _loads_response(' {"a": [1, 2]}\n') == {"a": [1, 2]}
+
+    def test_extra_data_raises(self):
+        with pytest.raises(json.JSONDecodeError, match="Extra data"):
+            _loads_response('for (;;);{"a": 1}{"b": 2}')
+
+    def test_invalid_json_raises(self):
+        with pytest.raises(json.JSONDecodeError):
+            _loads_response("for (;;);<html>")
+
+    @pytest.mark.parametrize("tail", ["\x0b", "\u3000", " \n\x0c"])
+    def test_non_json_trailing_whitespace_raises_like_json_loads(self, tail):
+        text = '{"a": 1}' + tail
+        with pytest.raises(json.JSONDecodeError) as expected:
+            json.loads(text)
+        with pytest.raises(json.JSONDecodeError) as actual:
+            _loads_response("for (;;);" + text)
+        assert actual.value.msg == expected.value.msg == "Extra data"
+        assert actual.value.pos - len("for (;;);") == expected.value.pos
@@ -1,5 +1,7 @@
 """Tests for meta_ads_collector.collector (validation and export logic)."""
 
+from unittest.mock import MagicMock
+
 import pytest
 
 from meta_ads_collector.collector import MetaAdsCollector
@@ -85,3 +87,17 @@ class TestCollectorConstants:
     def test_sort_constants(self):
         assert MetaAdsCollector.SORT_RELEVANCY is None
         assert MetaAdsCollector.SORT_IMPRESSIONS == "SORT_BY_TOTAL_IMPRESSIONS"
+
+
+class TestKeepRawData:
+    @pytest.mark.parametrize("keep", [True, False])
+    def test_search_respects_keep_raw_data(self, keep):
+        collector = MetaAdsCollector(rate_limit_delay=0, jitter=0, keep_raw_data=keep)
+        collector.client = MagicMock()
+        collector.client.search_ads.return_value = (
+            {"ads": [{"ad_archive_id": "ad-1"}], "page_info": {}},
+            None,
+        )
+        ads = list(collector.search(query="test", country="US"))
+        assert [ad.id for ad in ads] == ["ad-1"]
+        assert (ads[0].raw_data is not None) is keep
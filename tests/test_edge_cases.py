@@ -1107,7 +1107,7 @@ class TestMediaEdgeCases:
 
         filepath = tmp_path / "empty.jpg"
         with patch("meta_ads_collector.media.time.sleep"):
-            success, error, size = downloader._download_file(
+            success, error, size, _ = downloader._download_file(
                 "https://example.com/empty.jpg",
                 filepath,
             )
@@ -12,13 +12,14 @@ from __future__ import annotations
 
 import json
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from meta_ads_collector.logging_config import JSONFormatter, setup_logging
+from meta_ads_collector.logging_config import BufferedFileHandler, JSONFormatter, LazyJSONMessage, setup_logging
 
 # =========================================================================
 # JSONFormatter
@@ -177,6 +178,44 @@ class TestJSONFormatter:
         # Should not raise
         datetime.fromisoformat(ts)
 
+    def test_timestamp_uses_record_created(self):
+        """Timestamp should reflect record.created, not the time of formatting."""
+        formatter = JSONFormatter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="Old record",
+            args=None,
+            exc_info=None,
+        )
+        record.created = 1700000000.25
+        record.msecs = 250.0
+        parsed = json.loads(formatter.format(record))
+        assert parsed["timestamp"] == "2023-11-14T22:13:20.250+00:00"
+
+        # A second record in a later second must not reuse the cached prefix
+        record.created = 1700000061.5
+        record.msecs = 500.0
+        parsed = json.loads(formatter.format(record))
+        assert parsed["timestamp"] == "2023-11-14T22:14:21.500+00:00"
+
+    def test_dict_message_embedded_as_object(self):
+        """A dict message without args should be emitted as a nested object."""
+        formatter = JSONFormatter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg={"event": "page_fetched", "ads": 10},
+            args=None,
+            exc_info=None,
+        )
+        parsed = json.loads(formatter.format(record))
+        assert parsed["message"] == {"event": "page_fetched", "ads": 10}
+
     def test_debug_level(self):
         """DEBUG level should be represented correctly."""
         formatter = JSONFormatter()
@@ -194,6 +233,103 @@ class TestJSONFormatter:
         assert parsed["level"] == "DEBUG"
 
 
+# =========================================================================
+# LazyJSONMessage
+# =========================================================================
+
+
+class TestLazyJSONMessage:
+    """Tests for the LazyJSONMessage log argument wrapper."""
+
+    def test_renders_json_when_formatted(self):
+        """%s-formatting the wrapper should produce the JSON encoding."""
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=1,
+            msg="payload %s",
+            args=(LazyJSONMessage({"id": "123", "name": "caf\u00e9"}),),
+            exc_info=None,
+        )
+        assert record.getMessage() == 'payload {"id": "123", "name": "caf\u00e9"}'
+
+    def test_not_encoded_when_level_disabled(self):
+        """The payload should not be serialised for a filtered-out record."""
+        test_logger = logging.getLogger("test_lazy_json")
+        test_logger.setLevel(logging.INFO)
+        with patch("meta_ads_collector.logging_config.json.dumps") as mock_dumps:
+            test_logger.debug("payload %s", LazyJSONMessage({"a": 1}))
+        mock_dumps.assert_not_called()
+
+
+# =========================================================================
+# BufferedFileHandler
+# =========================================================================
+
+
+class TestBufferedFileHandler:
+    """Tests for the BufferedFileHandler class."""
+
+    def _record(self, msg: str, level: int = logging.INFO) -> logging.LogRecord:
+        return logging.LogRecord(
+            name="test", level=level, pathname="test.py", lineno=1,
+            msg=msg, args=None, exc_info=None,
+        )
+
+    def test_file_not_opened_until_first_record(self, tmp_path):
+        """The log file should only be created on the first emit."""
+        log_file = tmp_path / "lazy.log"
+        handler = BufferedFileHandler(str(log_file))
+        try:
+            assert not log_file.exists()
+            handler.emit(self._record("first"))
+            assert log_file.exists()
+        finally:
+            handler.close()
+
+    def test_info_records_buffered_until_flush(self, tmp_path):
+        """Non-error records should stay in the buffer until flushed."""
+        log_file = tmp_path / "buffered.log"
+        handler = BufferedFileHandler(str(log_file))
+        try:
+            handler.emit(self._record("buffered line"))
+            assert "buffered line" not in log_file.read_text(encoding="utf-8")
+            handler.flush()
+            assert "buffered line" in log_file.read_text(encoding="utf-8")
+        finally:
+            handler.close()
+
+    def test_error_records_flushed_immediately(self, tmp_path):
+        """ERROR records should reach the file without an explicit flush."""
+        log_file = tmp_path / "errors.log"
+        handler = BufferedFileHandler(str(log_file))
+        try:
+            handler.emit(self._record("routine"))
+            handler.emit(self._record("boom", level=logging.ERROR))
+            content = log_file.read_text(encoding="utf-8")
+            assert "routine" in content
+            assert "boom" in content
+        finally:
+            handler.close()
+
+    def test_errors_argument_applies_to_opened_file(self, tmp_path):
+        """The errors= policy should reach the stream opened on first emit."""
+        log_file = tmp_path / "ascii.log"
+        handler = BufferedFileHandler(str(log_file), encoding="ascii", errors="replace")
+        handler.emit(self._record("caf\u00e9"))
+        handler.close()
+        assert log_file.read_text(encoding="ascii").strip() == "caf?"
+
+    def test_close_flushes_buffer(self, tmp_path):
+        """Closing the handler should write out buffered records."""
+        log_file = tmp_path / "closed.log"
+        handler = BufferedFileHandler(str(log_file))
+        handler.emit(self._record("written on close"))
+        handler.close()
+        assert "written on close" in log_file.read_text(encoding="utf-8")
+
+
 # =========================================================================
 # setup_logging
 # =========================================================================
@@ -239,12 +375,44 @@ class TestSetupLogging:
         root = logging.getLogger()
         # Should have both console and file handlers
         assert len(root.handlers) == 2
-        file_handlers = [
-            h for h in root.handlers if isinstance(h, logging.FileHandler)
+        # The file handler is driven through a queue so producers never block
+        queue_handlers = [
+            h for h in root.handlers if isinstance(h, logging.handlers.QueueHandler)
         ]
-        assert len(file_handlers) == 1
+        assert len(queue_handlers) == 1
+        assert isinstance(queue_handlers[0].target, BufferedFileHandler)
+        self._cleanup_root_logger()
+
+    def test_file_logging_keeps_exception_info(self, tmp_path):
+        """Queued JSON records should still carry a structured exception."""
+        self._cleanup_root_logger()
+        log_file = tmp_path / "errors.jsonl"
+        setup_logging(level="INFO", fmt="json", log_file=str(log_file))
+        try:
+            raise RuntimeError("queued failure")
+        except RuntimeError:
+            logging.getLogger("test_queue_exc").exception("Failed with %s", "context")
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+        lines = log_file.read_text(encoding="utf-8").strip().split("\n")
+        parsed = json.loads(lines[-1])
+        assert parsed["message"] == "Failed with context"
+        assert "RuntimeError: queued failure" in parsed["exception"]
         self._cleanup_root_logger()
 
+    def test_close_drains_queue(self, tmp_path):
+        """Closing the handlers should write every queued record."""
+        self._cleanup_root_logger()
+        log_file = tmp_path / "drain.log"
+        setup_logging(level="INFO", log_file=str(log_file))
+        test_logger = logging.getLogger("test_queue_drain")
+        for i in range(200):
+            test_logger.info("record %d", i)
+        self._cleanup_root_logger()
+        content = log_file.read_text(encoding="utf-8")
+        assert "record 0" in content
+        assert "record 199" in content
+
     def test_file_handler_with_json_format(self, tmp_path):
         """File handler should use JSONFormatter when fmt='json'."""
         self._cleanup_root_logger()
@@ -1,6 +1,9 @@
 """Tests for meta_ads_collector.media."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import errno
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from curl_cffi.requests import Session as CffiSession
@@ -11,6 +14,7 @@ from curl_cffi.requests.exceptions import Timeout as CffiTimeout
 from meta_ads_collector.media import (
     MediaDownloader,
     MediaDownloadResult,
+    _write_all,
     detect_extension_from_content_type,
     detect_extension_from_url,
 )
@@ -194,6 +198,12 @@ class TestDetectExtensionFromContentType:
     def test_mixed_case(self):
         assert detect_extension_from_content_type("Image/JPEG") == ".jpg"
 
+    def test_results_are_cached(self):
+        detect_extension_from_content_type.cache_clear()
+        detect_extension_from_content_type("video/mp4")
+        detect_extension_from_content_type("video/mp4")
+        assert detect_extension_from_content_type.cache_info().hits == 1
+
 
 # ---------------------------------------------------------------------------
 # MediaDownloadResult
@@ -285,7 +295,7 @@ class TestSkipExisting:
         filepath = tmp_output_dir / "test_file.jpg"
         filepath.write_bytes(b"existing content")
 
-        success, error, size = downloader._download_file(
+        success, error, size, _ = downloader._download_file(
             "https://example.com/test.jpg",
             filepath,
         )
@@ -308,7 +318,7 @@ class TestSkipExisting:
         mock_response.raise_for_status.return_value = None
         downloader.session.get.return_value = mock_response
 
-        success, error, size = downloader._download_file(
+        success, error, size, _ = downloader._download_file(
             "https://example.com/test.jpg",
             filepath,
         )
@@ -327,7 +337,7 @@ class TestNeverRaises:
         # Make session.get raise a connection error
         downloader.session.get.side_effect = CffiConnectionError("DNS resolution failed")
 
-        success, error, size = downloader._download_file(
+        success, error, size, _ = downloader._download_file(
             "https://not-a-real-host.invalid/file.jpg",
             tmp_output_dir / "output.jpg",
         )
@@ -338,7 +348,7 @@ class TestNeverRaises:
     def test_timeout_does_not_propagate(self, downloader, tmp_output_dir):
         downloader.session.get.side_effect = CffiTimeout("Read timed out")
 
-        success, error, size = downloader._download_file(
+        success, error, size, _ = downloader._download_file(
             "https://slow-server.example.com/file.jpg",
             tmp_output_dir / "output.jpg",
         )
@@ -354,7 +364,7 @@ class TestNeverRaises:
         mock_response.iter_content.side_effect = OSError("Disk full")
         downloader.session.get.return_value = mock_response
 
-        success, error, size = downloader._download_file(
+        success, error, size, _ = downloader._download_file(
             "https://example.com/file.jpg",
             tmp_output_dir / "output.jpg",
         )
@@ -364,13 +374,61 @@ class TestNeverRaises:
     def test_unexpected_exception_does_not_propagate(self, downloader, tmp_output_dir):
         downloader.session.get.side_effect = RuntimeError("Something completely unexpected")
 
-        success, error, size = downloader._download_file(
+        success, error, size, _ = downloader._download_file(
             "https://example.com/file.jpg",
             tmp_output_dir / "output.jpg",
         )
         assert success is False
         assert "Unexpected error" in error
 
+    def test_head_preflight_rejects_expired_url(self, downloader, tmp_output_dir):
+        """With many recent 403s, a HEAD 403 should fail without streaming a GET."""
+        downloader._urls_attempted = 10
+        downloader._urls_expired = 5
+        downloader.session.head.return_value = MagicMock(status_code=403)
+
+        success, error, _, _ = downloader._download_file(
+            "https://cdn.facebook.com/expired.jpg?token=expired",
+            tmp_output_dir / "output.jpg",
+        )
+        assert success is False
+        assert "403" in error
+        downloader.session.get.assert_not_called()
+
+    def test_no_head_preflight_while_urls_are_fresh(self, downloader, tmp_output_dir):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "image/jpeg"}
+        mock_response.iter_content.return_value = [b"data"]
+        mock_response.raise_for_status.return_value = None
+        downloader.session.get.return_value = mock_response
+
+        success, _, _, _ = downloader._download_file("https://example.com/fresh.jpg", tmp_output_dir / "fresh.jpg")
+
+        assert success is True
+        downloader.session.head.assert_not_called()
+
+    def test_preflight_stops_after_early_burst_of_expired_urls(self, downloader, tmp_output_dir):
+        """The 403 rate is recent, not lifetime: fresh URLs switch preflight off again."""
+        # An early burst: 50 of 50 URLs expired.  A lifetime rate would stay
+        # above 20% for the next 200 downloads.
+        downloader._urls_attempted = 50
+        downloader._urls_expired = 50
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "image/jpeg"}
+        mock_response.iter_content.return_value = [b"data"]
+        mock_response.raise_for_status.return_value = None
+        downloader.session.get.return_value = mock_response
+        downloader.session.head.return_value = MagicMock(status_code=200)
+
+        for i in range(100):
+            downloader._download_file(f"https://example.com/{i}.jpg", tmp_output_dir / f"{i}.jpg")
+
+        assert not downloader._should_preflight()
+        assert 0 < downloader.session.head.call_count < 100
+
     def test_403_expired_url(self, downloader, tmp_output_dir):
         """403 (expired CDN URL) should return failure immediately without retrying."""
         mock_response = MagicMock()
@@ -380,7 +438,7 @@ class TestNeverRaises:
         mock_response.raise_for_status.side_effect = http_error
         downloader.session.get.return_value = mock_response
 
-        success, error, size = downloader._download_file(
+        success, error, size, _ = downloader._download_file(
             "https://cdn.facebook.com/expired.jpg?token=expired",
             tmp_output_dir / "output.jpg",
         )
@@ -532,7 +590,7 @@ class TestSuccessfulDownload:
         downloader.session.get.return_value = mock_response
 
         filepath = tmp_output_dir / "test.jpg"
-        success, error, size = downloader._download_file(
+        success, error, size, _ = downloader._download_file(
             "https://example.com/photo.jpg",
             filepath,
         )
@@ -540,6 +598,316 @@ class TestSuccessfulDownload:
         assert error is None
         assert size == len(b"chunk1") + len(b"chunk2") + len(b"chunk3")
 
+    def test_file_contents_match_chunks(self, downloader, tmp_output_dir):
+        """Chunks should be written to disk in order and unmodified."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "video/mp4"}
+        mock_response.iter_content.return_value = [b"\x00\x01", b"", b"\xff" * 70_000]
+        mock_response.raise_for_status.return_value = None
+        downloader.session.get.return_value = mock_response
+
+        filepath = tmp_output_dir / "clip.mp4"
+        success, _, size, _ = downloader._download_file("https://example.com/clip.mp4", filepath)
+        assert success is True
+        assert filepath.read_bytes() == b"\x00\x01" + b"\xff" * 70_000
+        assert size == 70_002
+
+    def test_short_writes_are_completed(self, tmp_output_dir):
+        """_write_all should keep writing until the whole buffer is on disk."""
+        filepath = tmp_output_dir / "short.bin"
+        real_write = os.write
+
+        def short_write(fd, data):
+            return real_write(fd, bytes(data[:3]))
+
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            with patch("meta_ads_collector.media.os.write", side_effect=short_write):
+                _write_all(fd, b"abcdefghij")
+        finally:
+            os.close(fd)
+        assert filepath.read_bytes() == b"abcdefghij"
+
+    def test_small_chunks_batched_into_few_writes(self, downloader, tmp_output_dir):
+        """Many small network chunks should be coalesced into 64 KiB writes."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "video/mp4"}
+        mock_response.iter_content.return_value = [bytes([i % 256]) * 1024 for i in range(200)]
+        mock_response.raise_for_status.return_value = None
+        downloader.session.get.return_value = mock_response
+
+        filepath = tmp_output_dir / "batched.mp4"
+        real_write = os.write
+        with patch("meta_ads_collector.media.os.write", side_effect=real_write) as mock_write:
+            success, _, size, _ = downloader._download_file("https://example.com/batched.mp4", filepath)
+
+        assert success is True
+        assert size == 200 * 1024
+        # 200 KiB in 64 KiB batches -> 4 writes instead of 200
+        assert mock_write.call_count == 4
+        assert filepath.read_bytes() == b"".join(bytes([i % 256]) * 1024 for i in range(200))
+
+    def test_large_file_released_from_page_cache(self, downloader, tmp_output_dir):
+        """Files past the threshold should get a DONTNEED hint; small ones not."""
+        def respond(chunks):
+            resp = MagicMock()
+            resp.status_code = 200
+            resp.headers = {"Content-Type": "video/mp4"}
+            resp.iter_content.return_value = chunks
+            resp.raise_for_status.return_value = None
+            return resp
+
+        downloader.session.get.side_effect = [
+            respond([b"\x00" * 65_536] * 16),  # exactly 1 MiB
+            respond([b"small"]),
+        ]
+        with patch("meta_ads_collector.media._release_page_cache") as release:
+            downloader._download_file("https://example.com/big.mp4", tmp_output_dir / "big.mp4")
+            assert release.call_count == 1
+            downloader._download_file("https://example.com/small.mp4", tmp_output_dir / "small.mp4")
+            assert release.call_count == 1
+
+    def test_staging_buffer_reused_across_downloads(self, downloader, tmp_output_dir):
+        """Sequential downloads should borrow the same staging buffer."""
+        def respond(payload):
+            resp = MagicMock()
+            resp.status_code = 200
+            resp.headers = {"Content-Type": "image/jpeg"}
+            resp.iter_content.return_value = [payload]
+            resp.raise_for_status.return_value = None
+            return resp
+
+        downloader.session.get.side_effect = [respond(b"first"), respond(b"second")]
+        downloader._download_file("https://example.com/a.jpg", tmp_output_dir / "a.jpg")
+        pooled = list(downloader._buffers)
+        downloader._download_file("https://example.com/b.jpg", tmp_output_dir / "b.jpg")
+
+        assert len(pooled) == 1
+        assert downloader._buffers == pooled and downloader._buffers[0] is pooled[0]
+        assert (tmp_output_dir / "a.jpg").read_bytes() == b"first"
+        assert (tmp_output_dir / "b.jpg").read_bytes() == b"second"
+
+    def test_preallocated_space_trimmed_to_body(self, downloader, tmp_output_dir):
+        """A Content-Length larger than the body must not leave padding behind."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "video/mp4", "Content-Length": "4096"}
+        mock_response.iter_content.return_value = [b"short body"]
+        mock_response.raise_for_status.return_value = None
+        downloader.session.get.return_value = mock_response
+
+        filepath = tmp_output_dir / "trimmed.mp4"
+        success, _, size, _ = downloader._download_file("https://example.com/trimmed.mp4", filepath)
+
+        assert success is True
+        assert size == 10
+        assert filepath.read_bytes() == b"short body"
+
+    def test_disk_full_fails_before_download(self, downloader, tmp_output_dir):
+        """ENOSPC from preallocation should fail fast without reading the body."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "video/mp4", "Content-Length": "1000000"}
+        mock_response.raise_for_status.return_value = None
+        downloader.session.get.return_value = mock_response
+
+        with patch("meta_ads_collector.media._HAS_FALLOCATE", True), \
+                patch("meta_ads_collector.media.os.posix_fallocate",
+                      side_effect=OSError(errno.ENOSPC, "No space left on device"), create=True):
+            success, error, size, _ = downloader._download_file(
+                "https://example.com/huge.mp4", tmp_output_dir / "huge.mp4",
+            )
+
+        assert success is False
+        assert "IO error" in error
+        mock_response.iter_content.assert_not_called()
+        assert downloader.session.get.call_count == 1
+
+    @staticmethod
+    def _interrupted_response(head, **headers):
+        """Response whose body fails after *head* has been streamed."""
+        def chunks():
+            yield head
+            raise CffiConnectionError("connection reset")
+
+        resp = MagicMock()
+        resp.status_code = 200
+        resp.headers = {"Content-Type": "video/mp4", **headers}
+        resp.iter_content.side_effect = lambda: chunks()
+        resp.raise_for_status.return_value = None
+        return resp
+
+    def test_retry_resumes_with_range_request(self, downloader, tmp_output_dir):
+        """A retry after a mid-transfer failure should only fetch the remainder."""
+        head = b"h" * 100_000  # large enough to bypass the staging buffer
+        resumed = MagicMock()
+        resumed.status_code = 206
+        resumed.headers = {
+            "Content-Type": "video/mp4",
+            "Content-Range": f"bytes {len(head)}-{len(head) + 3}/{len(head) + 4}",
+        }
+        resumed.iter_content.return_value = [b"tail"]
+        resumed.raise_for_status.return_value = None
+        downloader.session.get.side_effect = [self._interrupted_response(head), resumed]
+
+        filepath = tmp_output_dir / "resumed.mp4"
+        with patch("meta_ads_collector.media.time.sleep"):
+            success, _, size, _ = downloader._download_file("https://example.com/resumed.mp4", filepath)
+
+        assert success is True
+        assert size == len(head) + 4
+        assert filepath.read_bytes() == head + b"tail"
+        first, second = downloader.session.get.call_args_list
+        assert first.kwargs["headers"] is None
+        assert second.kwargs["headers"] == {"Range": f"bytes={len(head)}-"}
+
+    def test_retry_restarts_when_range_ignored(self, downloader, tmp_output_dir):
+        """A 200 reply to a Range request replaces the partial file."""
+        full = MagicMock()
+        full.status_code = 200
+        full.headers = {"Content-Type": "video/mp4"}
+        full.iter_content.return_value = [b"complete body"]
+        full.raise_for_status.return_value = None
+        downloader.session.get.side_effect = [self._interrupted_response(b"p" * 100_000), full]
+
+        filepath = tmp_output_dir / "restarted.mp4"
+        with patch("meta_ads_collector.media.time.sleep"):
+            success, _, size, _ = downloader._download_file("https://example.com/restarted.mp4", filepath)
+
+        assert success is True
+        assert size == 13
+        assert filepath.read_bytes() == b"complete body"
+
+    def test_partial_file_removed_after_final_failure(self, downloader, tmp_output_dir):
+        """A partial download must not be mistaken for a finished one later."""
+        downloader.session.get.side_effect = [
+            self._interrupted_response(b"p" * 100_000),
+            self._interrupted_response(b"p" * 100_000),
+        ]
+
+        filepath = tmp_output_dir / "broken.mp4"
+        with patch("meta_ads_collector.media.time.sleep"):
+            success, _, _, _ = downloader._download_file("https://example.com/broken.mp4", filepath)
+
+        assert success is False
+        assert not filepath.exists()
+
+    def test_partial_file_removed_after_non_retryable_failure(self, downloader, tmp_output_dir):
+        """A 403 on the resume attempt must not leave the truncated file behind."""
+        forbidden = MagicMock()
+        forbidden.status_code = 403
+        http_error = CffiHTTPError("403 Forbidden")
+        http_error.response = forbidden
+        forbidden.raise_for_status.side_effect = http_error
+        downloader.session.get.side_effect = [
+            self._interrupted_response(b"p" * 100_000), forbidden,
+        ]
+
+        filepath = tmp_output_dir / "expired.mp4"
+        with patch("meta_ads_collector.media.time.sleep"):
+            success, error, _, _ = downloader._download_file("https://example.com/expired.mp4", filepath)
+
+        assert success is False
+        assert "403" in error
+        assert not filepath.exists()
+
+    @staticmethod
+    def _range_not_satisfiable(**headers):
+        resp = MagicMock()
+        resp.status_code = 416
+        resp.headers = headers
+        http_error = CffiHTTPError("416 Range Not Satisfiable")
+        http_error.response = resp
+        resp.raise_for_status.side_effect = http_error
+        return resp
+
+    def test_416_after_complete_body_keeps_file(self, downloader, tmp_output_dir):
+        """A reset after the last byte, then 416 for the remainder: the file is done."""
+        body = b"p" * 100_000
+        downloader.max_retries = 3
+        downloader.session.get.side_effect = [
+            self._interrupted_response(body),
+            self._range_not_satisfiable(**{"Content-Range": f"bytes */{len(body)}"}),
+        ]
+
+        filepath = tmp_output_dir / "complete.mp4"
+        with patch("meta_ads_collector.media.time.sleep"):
+            success, _, size, _ = downloader._download_file("https://example.com/complete.mp4", filepath)
+
+        assert success is True
+        assert size == len(body)
+        assert filepath.read_bytes() == body
+        assert downloader.session.get.call_count == 2
+
+    def test_416_without_matching_length_falls_back_to_plain_get(self, downloader, tmp_output_dir):
+        """A 416 is never answered by repeating the same Range request."""
+        downloader.max_retries = 3
+        full = MagicMock()
+        full.status_code = 200
+        full.headers = {"Content-Type": "video/mp4"}
+        full.iter_content.return_value = [b"complete body"]
+        full.raise_for_status.return_value = None
+        downloader.session.get.side_effect = [
+            self._interrupted_response(b"p" * 100_000),
+            self._range_not_satisfiable(),
+            full,
+        ]
+
+        filepath = tmp_output_dir / "changed.mp4"
+        with patch("meta_ads_collector.media.time.sleep"):
+            success, _, _, _ = downloader._download_file("https://example.com/changed.mp4", filepath)
+
+        assert success is True
+        assert filepath.read_bytes() == b"complete body"
+        headers = [c.kwargs["headers"] for c in downloader.session.get.call_args_list]
+        assert headers == [None, {"Range": "bytes=100000-"}, None]
+
+    def test_mismatched_content_range_restarts(self, downloader, tmp_output_dir):
+        """A 206 body that does not continue at the file's end is not appended."""
+        downloader.max_retries = 3
+        wrong = MagicMock()
+        wrong.status_code = 206
+        wrong.headers = {"Content-Type": "video/mp4", "Content-Range": "bytes 0-3/100004"}
+        wrong.raise_for_status.return_value = None
+        full = MagicMock()
+        full.status_code = 200
+        full.headers = {"Content-Type": "video/mp4"}
+        full.iter_content.return_value = [b"complete body"]
+        full.raise_for_status.return_value = None
+        downloader.session.get.side_effect = [
+            self._interrupted_response(b"p" * 100_000), wrong, full,
+        ]
+
+        filepath = tmp_output_dir / "misranged.mp4"
+        with patch("meta_ads_collector.media.time.sleep"):
+            success, _, size, _ = downloader._download_file("https://example.com/misranged.mp4", filepath)
+
+        assert success is True
+        assert filepath.read_bytes() == b"complete body"
+        wrong.iter_content.assert_not_called()
+        assert downloader.session.get.call_args_list[2].kwargs["headers"] is None
+
+    def test_encoded_body_not_resumed(self, downloader, tmp_output_dir):
+        """Range offsets of a gzip-encoded response do not match the decoded file."""
+        full = MagicMock()
+        full.status_code = 200
+        full.headers = {"Content-Type": "video/mp4"}
+        full.iter_content.return_value = [b"complete body"]
+        full.raise_for_status.return_value = None
+        downloader.session.get.side_effect = [
+            self._interrupted_response(b"p" * 100_000, **{"Content-Encoding": "gzip"}), full,
+        ]
+
+        filepath = tmp_output_dir / "encoded.mp4"
+        with patch("meta_ads_collector.media.time.sleep"):
+            success, _, _, _ = downloader._download_file("https://example.com/encoded.mp4", filepath)
+
+        assert success is True
+        assert filepath.read_bytes() == b"complete body"
+        assert downloader.session.get.call_args_list[1].kwargs["headers"] is None
+
     def test_retry_on_server_error(self, downloader, tmp_output_dir):
         """Test retry logic with exponential backoff."""
         # First attempt: 500 error, second attempt: success
@@ -559,7 +927,7 @@ class TestSuccessfulDownload:
 
         filepath = tmp_output_dir / "retry_test.jpg"
         with patch("meta_ads_collector.media.time.sleep"):
-            success, error, size = downloader._download_file(
+            success, error, size, _ = downloader._download_file(
                 "https://example.com/photo.jpg",
                 filepath,
             )
@@ -567,6 +935,18 @@ class TestSuccessfulDownload:
         assert size == len(b"image_data")
         assert downloader.session.get.call_count == 2
 
+    def test_retry_backoff_is_jittered(self, downloader, tmp_output_dir):
+        """The first retry waits a random 0.5-1.5s rather than a fixed 1s."""
+        downloader.max_retries = 3
+        downloader.session.get.side_effect = CffiConnectionError("reset")
+
+        with patch("meta_ads_collector.media.time.sleep") as mock_sleep, \
+                patch("meta_ads_collector.media.random.uniform", return_value=0.75) as mock_uniform:
+            downloader._download_file("https://example.com/photo.jpg", tmp_output_dir / "jitter.jpg")
+
+        mock_uniform.assert_called_with(0.5, 1.5)
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.75, 1.5]
+
 
 # ---------------------------------------------------------------------------
 # Integration: download_ad_media
@@ -623,3 +1003,227 @@ class TestDownloadAdMedia:
         # Some should succeed, some should fail
         assert len(results) == 5
         assert len(successes) > 0 or len(failures) > 0  # At least some results
+
+    def test_local_path_follows_content_type_extension(self, downloader, tmp_output_dir):
+        """The result path is the file actually written, with no directory scan."""
+        ad = Ad(id="AD009", creatives=[AdCreative(image_url="https://cdn.example.com/media/12345")])
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "image/png"}
+        mock_response.iter_content.return_value = [b"data"]
+        mock_response.raise_for_status.return_value = None
+        downloader.session.get.return_value = mock_response
+
+        with patch.object(type(tmp_output_dir), "glob", side_effect=AssertionError("glob called")):
+            results = downloader.download_ad_media(ad)
+
+        assert results[0].local_path == str(tmp_output_dir / "AD009_0_image.png")
+        assert (tmp_output_dir / "AD009_0_image.png").read_bytes() == b"data"
+
+    def test_repeated_url_downloaded_once(self, downloader, tmp_output_dir):
+        """A URL repeated across fields and creatives is fetched only once."""
+        url = "https://cdn.example.com/shared.jpg"
+        ad = Ad(id="AD010", creatives=[
+            AdCreative(image_url=url, thumbnail_url=url),
+            AdCreative(image_url=url),
+        ])
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "image/jpeg"}
+        mock_response.iter_content.return_value = [b"shared"]
+        mock_response.raise_for_status.return_value = None
+        downloader.session.get.return_value = mock_response
+
+        results = downloader.download_ad_media(ad)
+
+        assert downloader.session.get.call_count == 1
+        assert [(r.creative_index, r.media_type) for r in results] == [(0, "image"), (0, "thumbnail"), (1, "image")]
+        assert all(r.success and r.file_size == 6 for r in results)
+        original = os.stat(results[0].local_path)
+        for r in results[1:]:
+            assert r.local_path != results[0].local_path
+            assert os.path.samestat(os.stat(r.local_path), original)
+
+
+# ---------------------------------------------------------------------------
+# Concurrent downloads: download_ad_media_async
+# ---------------------------------------------------------------------------
+
+
+class _FakeAsyncResponse:
+    """Minimal stand-in for a streamed curl_cffi async response."""
+
+    def __init__(self, chunks, content_type="image/jpeg", status_code=200, **headers):
+        self.status_code = status_code
+        self.headers = {"Content-Type": content_type, **headers}
+        self._chunks = chunks
+        self.closed = False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            error = CffiHTTPError(f"HTTP {self.status_code}")
+            error.response = self
+            raise error
+
+    async def aiter_content(self, chunk_size=None):
+        for chunk in self._chunks:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+    async def aclose(self):
+        self.closed = True
+
+
+class TestDownloadAdMediaAsync:
+    async def test_results_match_sequential_order(self, downloader, ad_with_media):
+        session = MagicMock()
+        session.get = AsyncMock(side_effect=lambda *a, **kw: _FakeAsyncResponse([b"data"]))
+
+        results = await downloader.download_ad_media_async(ad_with_media, session=session)
+
+        assert [(r.creative_index, r.media_type) for r in results] == [
+            (0, "image"), (0, "video_hd"), (0, "video_sd"), (0, "thumbnail"), (1, "image"),
+        ]
+        assert all(r.success for r in results)
+        assert all(r.file_size == 4 for r in results)
+        assert session.get.await_count == 5
+
+    async def test_repeated_url_downloaded_once(self, downloader):
+        url = "https://cdn.example.com/shared.jpg"
+        ad = Ad(id="AD011", creatives=[AdCreative(image_url=url, thumbnail_url=url)])
+        session = MagicMock()
+        session.get = AsyncMock(side_effect=lambda *a, **kw: _FakeAsyncResponse([b"data"]))
+
+        results = await downloader.download_ad_media_async(ad, session=session)
+
+        assert session.get.await_count == 1
+        assert [r.media_type for r in results] == ["image", "thumbnail"]
+        assert all(r.success for r in results)
+        assert results[1].local_path.endswith("AD011_0_thumbnail.jpg")
+
+    async def test_concurrency_is_bounded(self, tmp_output_dir, ad_with_media):
+        downloader = MediaDownloader(output_dir=tmp_output_dir, session=MagicMock(), max_concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def slow_get(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _FakeAsyncResponse([b"data"])
+
+        session = MagicMock()
+        session.get = slow_get
+
+        results = await downloader.download_ad_media_async(ad_with_media, session=session)
+        assert len(results) == 5
+        assert peak == 2
+
+    async def test_failures_are_reported_not_raised(self, downloader, ad_with_media):
+        session = MagicMock()
+        session.get = AsyncMock(side_effect=CffiConnectionError("offline"))
+
+        with patch("meta_ads_collector.media.asyncio.sleep", new=AsyncMock()):
+            results = await downloader.download_ad_media_async(ad_with_media, session=session)
+
+        assert len(results) == 5
+        assert all(not r.success and "Connection error" in r.error for r in results)
+
+    async def test_retry_resumes_with_range_request(self, downloader, tmp_output_dir):
+        head = b"h" * 100_000
+        session = MagicMock()
+        session.get = AsyncMock(side_effect=[
+            _FakeAsyncResponse([head, CffiConnectionError("reset")], content_type="video/mp4"),
+            _FakeAsyncResponse(
+                [b"tail"], content_type="video/mp4", status_code=206,
+                **{"Content-Range": f"bytes {len(head)}-{len(head) + 3}/{len(head) + 4}"},
+            ),
+        ])
+        filepath = tmp_output_dir / "resumed_async.mp4"
+
+        with patch("meta_ads_collector.media.asyncio.sleep", new=AsyncMock()):
+            success, _, size, _ = await downloader._download_file_async(
+                session, "https://example.com/resumed_async.mp4", filepath,
+            )
+
+        assert success is True
+        assert size == len(head) + 4
+        assert filepath.read_bytes() == head + b"tail"
+        assert session.get.call_args_list[1].kwargs["headers"] == {"Range": f"bytes={len(head)}-"}
+
+    async def test_416_after_complete_body_keeps_file(self, downloader, tmp_output_dir):
+        body = b"h" * 100_000
+        session = MagicMock()
+        session.get = AsyncMock(side_effect=[
+            _FakeAsyncResponse([body, CffiConnectionError("reset")], content_type="video/mp4"),
+            _FakeAsyncResponse([], content_type="video/mp4", status_code=416,
+                               **{"Content-Range": f"bytes */{len(body)}"}),
+        ])
+        filepath = tmp_output_dir / "complete_async.mp4"
+
+        with patch("meta_ads_collector.media.asyncio.sleep", new=AsyncMock()):
+            success, _, size, _ = await downloader._download_file_async(
+                session, "https://example.com/complete_async.mp4", filepath,
+            )
+
+        assert success is True
+        assert size == len(body)
+        assert filepath.read_bytes() == body
+
+    async def test_416_falls_back_to_plain_get(self, downloader, tmp_output_dir):
+        downloader.max_retries = 3
+        session = MagicMock()
+        session.get = AsyncMock(side_effect=[
+            _FakeAsyncResponse([b"h" * 100_000, CffiConnectionError("reset")], content_type="video/mp4"),
+            _FakeAsyncResponse([], content_type="video/mp4", status_code=416),
+            _FakeAsyncResponse([b"complete body"], content_type="video/mp4"),
+        ])
+        filepath = tmp_output_dir / "changed_async.mp4"
+
+        with patch("meta_ads_collector.media.asyncio.sleep", new=AsyncMock()):
+            success, _, _, _ = await downloader._download_file_async(
+                session, "https://example.com/changed_async.mp4", filepath,
+            )
+
+        assert success is True
+        assert filepath.read_bytes() == b"complete body"
+        assert [c.kwargs["headers"] for c in session.get.call_args_list] == [
+            None, {"Range": "bytes=100000-"}, None,
+        ]
+
+    async def test_temporary_session_copies_proxies_and_cookies(self, tmp_output_dir, ad_with_media):
+        source = CffiSession(impersonate="chrome", proxies={"https": "http://proxy.example:8080"})
+        source.cookies.set("datr", "abc", domain=".facebook.com")
+        downloader = MediaDownloader(output_dir=tmp_output_dir, session=source)
+        fake_session = MagicMock()
+        fake_session.get = AsyncMock(side_effect=lambda *a, **kw: _FakeAsyncResponse([b"data"]))
+        fake_session.close = AsyncMock()
+
+        with patch("meta_ads_collector.media.CffiAsyncSession", return_value=fake_session) as session_cls:
+            await downloader.download_ad_media_async(ad_with_media)
+
+        kwargs = session_cls.call_args.kwargs
+        assert kwargs["proxies"] == {"https": "http://proxy.example:8080"}
+        assert kwargs["cookies"].get("datr") == "abc"
+        assert kwargs["headers"] is source.headers
+        source.close()
+
+    async def test_temporary_session_is_closed(self, downloader, ad_with_media):
+        fake_session = MagicMock()
+        fake_session.get = AsyncMock(side_effect=lambda *a, **kw: _FakeAsyncResponse([b"data"]))
+        fake_session.close = AsyncMock()
+
+        with patch("meta_ads_collector.media.CffiAsyncSession", return_value=fake_session):
+            results = await downloader.download_ad_media_async(ad_with_media)
+
+        assert len(results) == 5
+        fake_session.close.assert_awaited_once()
+
+    async def test_no_media_skips_session(self, downloader, ad_no_media):
+        with patch("meta_ads_collector.media.CffiAsyncSession") as session_cls:
+            results = await downloader.download_ad_media_async(ad_no_media)
+        assert results == []
+        session_cls.assert_not_called()
@@ -1,15 +1,27 @@
 """Tests for meta_ads_collector.models."""
 
+import dataclasses
 import json
-from datetime import datetime
+import pickle
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
 
 from meta_ads_collector.models import (
     Ad,
     AdCreative,
+    AudienceDistribution,
     ImpressionRange,
     PageInfo,
+    PageSearchResult,
     SearchResult,
     SpendRange,
+    TargetingInfo,
+    _isoformat,
+    _parse_datetime,
+    _parse_impression_text,
+    _parse_spend_string,
 )
 
 # ---------------------------------------------------------------------------
@@ -79,6 +91,107 @@ class TestPageInfo:
         assert d["verified"] is True
 
 
+# ---------------------------------------------------------------------------
+# Field parsing helpers
+# ---------------------------------------------------------------------------
+
+class TestRangeParsing:
+    @pytest.mark.parametrize("text,expected", [
+        ("$9K-$10K", (9_000, 10_000)),
+        ("$1,500 - $2,000", (1_500, 2_000)),
+        ("$1.5M-$2M", (1_500_000, 2_000_000)),
+        ("$100", (100, 100)),
+        ("$1.15M", (1_150_000, 1_150_000)),
+        ("$.5K-$1.2.3K", (500, 500)),
+        ("no numbers", (None, None)),
+    ])
+    def test_spend(self, text, expected):
+        assert _parse_spend_string(text) == expected
+
+    @pytest.mark.parametrize("text,expected", [
+        ("1K-5K", (1_000, 5_000)),
+        (">1M", (1_000_000, None)),
+        ("2B", (2_000_000_000, None)),
+        ("", (None, None)),
+    ])
+    def test_impressions(self, text, expected):
+        assert _parse_impression_text(text) == expected
+
+
+class TestParseDatetime:
+    def test_epoch_seconds(self):
+        assert _parse_datetime(0) == datetime.fromtimestamp(0)
+
+    def test_iso_with_z_suffix(self):
+        parsed = _parse_datetime("2024-01-15T10:30:00Z")
+        assert parsed == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+
+    def test_offset_without_colon(self):
+        parsed = _parse_datetime("2024-01-15T10:30:00+0000")
+        assert parsed == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        assert _parse_datetime("2024-01-15T10:30:00-0500").utcoffset() == timedelta(hours=-5)
+
+    def test_date_only(self):
+        assert _parse_datetime("2024-01-15") == datetime(2024, 1, 15)
+
+    def test_datetime_passes_through(self):
+        value = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        assert _parse_datetime(value) is value
+
+    @pytest.mark.parametrize("value", ["not a date", 10**20, ["2024-01-15"]])
+    def test_unparseable_returns_none(self, value):
+        assert _parse_datetime(value) is None
+
+    def test_isoformat_keeps_offset_of_equal_instants(self):
+        utc = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        plus_one = utc.astimezone(timezone(timedelta(hours=1)))
+        assert utc == plus_one
+        assert _isoformat(utc) == "2024-01-15T10:30:00+00:00"
+        assert _isoformat(plus_one) == "2024-01-15T11:30:00+01:00"
+
+    def test_isoformat_keeps_offset_of_ambiguous_dst_hour(self):
+        zoneinfo = pytest.importorskip("zoneinfo")
+        try:
+            tz = zoneinfo.ZoneInfo("America/New_York")
+        except zoneinfo.ZoneInfoNotFoundError:
+            pytest.skip("time zone data not available")
+        first = datetime(2024, 11, 3, 1, 30, tzinfo=tz)
+        second = first.replace(fold=1)
+        assert first == second
+        assert _isoformat(first) == "2024-11-03T01:30:00-04:00"
+        assert _isoformat(second) == "2024-11-03T01:30:00-05:00"
+
+
+# ---------------------------------------------------------------------------
+# Hand-written to_dict() methods
+# ---------------------------------------------------------------------------
+
+class TestToDictMatchesFields:
+    @pytest.mark.parametrize("obj", [
+        AudienceDistribution(category="25-34_male", percentage=0.4),
+        AdCreative(**{f.name: "x" for f in dataclasses.fields(AdCreative)}),
+        PageInfo(id="1", name="Page"),
+        PageSearchResult(page_id="1", page_name="Page"),
+        TargetingInfo(genders=["female"]),
+    ])
+    def test_same_output_as_asdict(self, obj):
+        assert obj.to_dict() == dataclasses.asdict(obj)
+
+    def test_targeting_lists_are_copies(self):
+        targeting = TargetingInfo(genders=["female"])
+        targeting.to_dict()["genders"].append("male")
+        assert targeting.genders == ["female"]
+
+
+class TestDataclassSlots:
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_models_are_slotted(self):
+        ad = Ad(id="1", page=PageInfo(id="p", name="Page"), creatives=[AdCreative(body="b")])
+        assert not hasattr(ad, "__dict__")
+        assert not hasattr(ad.page, "__dict__")
+        assert pickle.loads(pickle.dumps(ad)) == ad
+
+
 # ---------------------------------------------------------------------------
 # Ad
 # ---------------------------------------------------------------------------
@@ -98,6 +211,18 @@ class TestAd:
         parsed = json.loads(j)
         assert parsed["id"] == "12345"
 
+    def test_to_json_compact(self, sample_ad):
+        line = sample_ad.to_json(indent=None)
+        assert "\n" not in line
+        assert line == json.dumps(sample_ad.to_dict(), ensure_ascii=False)
+
+    def test_to_dict_omit_empty(self, sample_ad):
+        d = sample_ad.to_dict(omit_empty=True)
+        assert "funding_entity" not in d  # None
+        assert "bylines" not in d  # []
+        assert d["publisher_platforms"] == ["facebook", "instagram"]
+        assert set(d) < set(sample_ad.to_dict())
+
     def test_to_dict_excludes_raw_by_default(self, sample_ad):
         sample_ad.raw_data = {"some": "data"}
         d = sample_ad.to_dict()
@@ -151,6 +276,90 @@ class TestAd:
         assert ad.creatives[0].body == "Body text"
         assert ad.creatives[0].title == "Title text"
 
+    def test_from_graphql_response_old_format_creative_count(self):
+        ad = Ad.from_graphql_response({
+            "ad_archive_id": "887",
+            "ad_creative_bodies": ["B1", "B2"],
+            "ad_creative_link_captions": ["C1", "C2", "C3"],
+            "ad_creative_link_titles": ["T1"],
+            "snapshot": {"cards": [{"link_url": "https://a.example"}]},
+        })
+        assert [(c.body, c.caption, c.title) for c in ad.creatives] == [
+            ("B1", "C1", "T1"), ("B2", "C2", None),
+        ]
+        assert [c.link_url for c in ad.creatives] == ["https://a.example", None]
+
+        empty = Ad.from_graphql_response({"ad_archive_id": "886", "snapshot": {"cards": []}})
+        assert len(empty.creatives) == 1 and empty.creatives[0].body is None
+
+    def test_from_graphql_response_camel_case_aliases(self):
+        data = {
+            "adArchiveID": "777",
+            "adStatus": "ACTIVE",
+            "spendWithIndex": {"lowerBound": 100, "upperBound": 200},
+            "publisherPlatforms": ["instagram"],
+            "fundingEntity": "Org",
+            "collationCount": 3,
+        }
+        ad = Ad.from_graphql_response(data)
+        assert ad.id == "777"
+        assert ad.ad_status == "ACTIVE"
+        assert ad.is_active is True
+        assert (ad.spend.lower_bound, ad.spend.upper_bound) == (100, 200)
+        assert ad.publisher_platforms == ["instagram"]
+        assert ad.funding_entity == "Org"
+        assert ad.collation_count == 3
+        assert ad.raw_data is data and "ad_status" not in data
+
+    def test_from_graphql_response_camel_case_falsy_values(self):
+        ad = Ad.from_graphql_response({
+            "adArchiveID": "778",
+            "isActive": False,
+            "spendWithIndex": {"lowerBound": 0, "upperBound": 100},
+            "impressions": {"lowerBound": 0, "upperBound": 100},
+            "collationCount": 0,
+        })
+        assert ad.is_active is False
+        assert ad.spend.lower_bound == 0 and str(ad.spend).endswith("0 - 100")
+        assert ad.impressions.lower_bound == 0
+        assert ad.collation_count == 0
+
+    def test_from_graphql_responses_batch(self, sample_graphql_ad_data):
+        ads = Ad.from_graphql_responses([sample_graphql_ad_data, {"ad_archive_id": "999"}])
+        assert [ad.id for ad in ads] == [Ad.from_graphql_response(sample_graphql_ad_data).id, "999"]
+        assert ads[0].collected_at is ads[1].collected_at
+        assert ads[0].collected_at.tzinfo is timezone.utc
+
+    def test_from_graphql_response_collected_at(self, sample_graphql_ad_data):
+        when = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        assert Ad.from_graphql_response(sample_graphql_ad_data, collected_at=when).collected_at is when
+
+    def test_from_graphql_response_keep_raw_false(self, sample_graphql_ad_data):
+        ad = Ad.from_graphql_response(sample_graphql_ad_data, keep_raw=False)
+        assert ad.raw_data is None
+        assert ad.id == Ad.from_graphql_response(sample_graphql_ad_data).id
+        assert "raw_data" not in ad.to_dict(include_raw=True)
+        assert all(a.raw_data is None for a in Ad.from_graphql_responses([sample_graphql_ad_data], keep_raw=False))
+
+    def test_from_graphql_response_interns_repeated_strings(self):
+        payload = (
+            '{"ad_archive_id": "1", "publisher_platform": ["FACEBOOK"], "currency": "USD",'
+            ' "ad_status": "ACTIVE", "delivery_by_region": [{"region": "Texas", "percentage": 1}],'
+            ' "languages": ["en"], "page_categories": ["Retail"],'
+            ' "page_id": "42", "page_name": "Shop", "funding_entity": "Shop Inc"}'
+        )
+        first = Ad.from_graphql_response(json.loads(payload))
+        second = Ad.from_graphql_response(json.loads(payload))
+        assert first.publisher_platforms[0] is second.publisher_platforms[0]
+        assert first.currency is second.currency
+        assert first.ad_status is second.ad_status
+        assert first.region_distribution[0].category is second.region_distribution[0].category
+        assert first.languages[0] is second.languages[0]
+        assert first.categories[0] is second.categories[0]
+        assert first.page.id is second.page.id
+        assert first.page.name is second.page.name
+        assert first.funding_entity is second.funding_entity
+
     def test_from_graphql_response_demographics(self, sample_graphql_ad_data):
         ad = Ad.from_graphql_response(sample_graphql_ad_data)
         assert len(ad.age_gender_distribution) == 1
@@ -159,6 +368,20 @@ class TestAd:
         assert len(ad.region_distribution) == 1
         assert ad.region_distribution[0].category == "California"
 
+    def test_from_graphql_response_skips_malformed_distribution_entries(self):
+        ad = Ad.from_graphql_response({
+            "ad_archive_id": "1",
+            "demographic_distribution": [
+                {"age": "18-24", "gender": "female", "percentage": "0.5"},
+                "garbage",
+                {"age": "65+", "gender": "male", "percentage": 0.1},
+            ],
+            "delivery_by_region": [None, {"region": "Texas", "percentage": 1}],
+        })
+        assert [d.category for d in ad.age_gender_distribution] == ["18-24_female", "65+_male"]
+        assert ad.age_gender_distribution[0].percentage == 0.5
+        assert [(d.category, d.percentage) for d in ad.region_distribution] == [("Texas", 1.0)]
+
 
 # ---------------------------------------------------------------------------
 # SearchResult
@@ -176,3 +399,10 @@ class TestSearchResult:
         assert len(d["ads"]) == 1
         assert d["total_count"] == 1
         assert d["has_next_page"] is False
+
+    def test_to_json(self, sample_ad):
+        result = SearchResult(ads=[sample_ad], total_count=1, end_cursor="abc")
+        parsed = json.loads(result.to_json(indent=None))
+        assert parsed == json.loads(json.dumps(result.to_dict()))
+        assert parsed["ads"][0]["id"] == "12345"
+        assert json.loads(result.to_json()) == parsed
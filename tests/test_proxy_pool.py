@@ -1,6 +1,8 @@
 """Tests for meta_ads_collector.proxy_pool."""
 
 
+import time
+
 import pytest
 
 from meta_ads_collector.client import MetaAdsClient
@@ -62,6 +64,21 @@ class TestProxyPoolRoundRobin:
         # Fourth should be same as first
         assert fourth == first
 
+    def test_skips_dead_proxy_and_keeps_order(self):
+        pool = ProxyPool(
+            ["1.2.3.4:8080", "5.6.7.8:8080", "9.10.11.12:8080"],
+            max_failures=1,
+            cooldown=9999.0,
+        )
+        pool.mark_failure("http://5.6.7.8:8080")
+        picks = [pool.get_next() for _ in range(4)]
+        assert picks == [
+            "http://1.2.3.4:8080", "http://9.10.11.12:8080",
+            "http://1.2.3.4:8080", "http://9.10.11.12:8080",
+        ]
+        pool.mark_success("http://5.6.7.8:8080")
+        assert {pool.get_next() for _ in range(3)} == set(pool._proxies)
+
     def test_single_proxy_always_same(self):
         pool = ProxyPool(["1.2.3.4:8080"])
         assert pool.get_next() == pool.get_next()
@@ -132,6 +149,14 @@ class TestProxyPoolRecovery:
         pool.mark_failure(proxy)
         assert proxy not in pool.alive_proxies
 
+    def test_cooldown_ignores_wall_clock_jumps(self, monkeypatch):
+        pool = ProxyPool(["1.2.3.4:8080"], max_failures=1, cooldown=60.0)
+        proxy = pool.get_next()
+        pool.mark_failure(proxy)
+        real_time = time.time
+        monkeypatch.setattr(time, "time", lambda: real_time() + 3600)
+        assert proxy not in pool.alive_proxies
+
     def test_reset_revives_all(self):
         pool = ProxyPool(
             ["1.2.3.4:8080", "5.6.7.8:8080"],
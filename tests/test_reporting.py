@@ -12,9 +12,12 @@ from __future__ import annotations
 
 import json
 import sys
-from datetime import datetime
+from dataclasses import fields
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
+import pytest
+
 from meta_ads_collector.reporting import (
     CollectionReport,
     format_report,
@@ -61,6 +64,10 @@ class TestCollectionReport:
         assert report.start_time == start
         assert report.end_time == end
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_uses_slots(self):
+        assert not hasattr(CollectionReport(), "__dict__")
+
 
 # =========================================================================
 # format_report
@@ -203,6 +210,23 @@ class TestFormatReportJson:
         assert parsed["errors"] == report.errors
         assert parsed["duration_seconds"] == report.duration_seconds
 
+    def test_times_match_across_formats(self):
+        """Text and JSON output carry the same ISO timestamps, offsets included."""
+        start = datetime(2031, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        end = datetime(2031, 1, 2, 5, 4, 5, tzinfo=timezone(timedelta(hours=2)))
+        report = CollectionReport(start_time=start, end_time=end)
+        text = format_report(report)
+        parsed = json.loads(format_report_json(report))
+        assert "Start time:         2031-01-02T03:04:05+00:00" in text
+        assert "End time:           2031-01-02T05:04:05+02:00" in text
+        assert parsed["start_time"] == "2031-01-02T03:04:05+00:00"
+        assert parsed["end_time"] == "2031-01-02T05:04:05+02:00"
+
+    def test_keys_follow_dataclass_fields(self):
+        """Every CollectionReport field is emitted, in declaration order."""
+        parsed = json.loads(format_report_json(CollectionReport()))
+        assert list(parsed) == [f.name for f in fields(CollectionReport)]
+
 
 # =========================================================================
 # CLI integration
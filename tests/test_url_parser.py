@@ -2,10 +2,30 @@
 
 import sys
 from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs
+
+import pytest
 
 from meta_ads_collector.cli import parse_args
 from meta_ads_collector.events import EventEmitter
-from meta_ads_collector.url_parser import extract_page_id_from_url
+from meta_ads_collector.url_parser import _query_value, extract_page_id_from_url
+
+# ---------------------------------------------------------------------------
+# _query_value
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("query", [
+    "id=&id=123",
+    "a=1&view_all_page_id=12%334",
+    "view_all_page_id=abc&view_all_page_id=123",
+    "x=1",
+    "id=1+2",
+    "",
+])
+@pytest.mark.parametrize("key", ["id", "view_all_page_id"])
+def test_query_value_matches_parse_qs(query, key):
+    assert _query_value(query, key) == parse_qs(query).get(key, [None])[0]
+
 
 # ---------------------------------------------------------------------------
 # extract_page_id_from_url
@@ -70,6 +90,10 @@ class TestExtractPageIdFromUrl:
         url = "https://www.facebook.com/pages/SomeName/123456"
         assert extract_page_id_from_url(url) == "123456"
 
+    def test_numeric_id_before_trailing_segment(self):
+        url = "https://www.facebook.com/pages/123456/about"
+        assert extract_page_id_from_url(url) == "123456"
+
     # -- Vanity URLs (cannot resolve without network) --
 
     def test_vanity_url_returns_none(self):
@@ -98,6 +122,17 @@ class TestExtractPageIdFromUrl:
     def test_non_facebook_url(self):
         assert extract_page_id_from_url("https://www.google.com/123456") is None
 
+    def test_non_facebook_url_skips_urlparse(self):
+        with patch("meta_ads_collector.url_parser.urlparse") as urlparse:
+            assert extract_page_id_from_url("https://example.org/p?id=123456") is None
+        urlparse.assert_not_called()
+
+    def test_uppercase_host_still_accepted(self):
+        assert extract_page_id_from_url("https://WWW.FACEBOOK.COM/pages/x/123456") == "123456"
+
+    def test_lookalike_host_rejected(self):
+        assert extract_page_id_from_url("https://notfacebook.com.evil.test/123456") is None
+
     def test_bare_numeric_id(self):
         """A bare numeric string should be returned as-is."""
         assert extract_page_id_from_url("123456") == "123456"
@@ -128,6 +163,24 @@ class TestExtractPageIdFromUrl:
     def test_non_string_input(self):
         assert extract_page_id_from_url(12345) is None
 
+    def test_canonical_numeric_url_skips_urlparse(self):
+        with patch("meta_ads_collector.url_parser.urlparse") as urlparse:
+            assert extract_page_id_from_url("https://www.facebook.com/123456/") == "123456"
+            assert extract_page_id_from_url("http://m.facebook.com/123456") == "123456"
+        urlparse.assert_not_called()
+
+    def test_repeat_url_is_cached(self):
+        url = "https://www.facebook.com/profile.php?id=654321"
+        extract_page_id_from_url.cache_clear()
+        assert extract_page_id_from_url(url) == "654321"
+        with patch("meta_ads_collector.url_parser.urlparse") as urlparse:
+            assert extract_page_id_from_url("  " + url + " ") == "654321"
+        urlparse.assert_not_called()
+        extract_page_id_from_url.cache_clear()
+        with patch("meta_ads_collector.url_parser.urlparse", side_effect=ValueError):
+            assert extract_page_id_from_url(url) is None
+        extract_page_id_from_url.cache_clear()
+
     def test_url_with_fragment(self):
         url = "https://www.facebook.com/123456#section"
         assert extract_page_id_from_url(url) == "123456"
@@ -1,7 +1,9 @@
 """Tests for meta_ads_collector.webhooks (WebhookSender)."""
 
+import asyncio
 import sys
-from unittest.mock import MagicMock, patch
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from curl_cffi.requests import Session as CffiSession
@@ -194,6 +196,8 @@ class TestWebhookAsCallback:
         for _ in range(3):
             event = Event(event_type=AD_COLLECTED, data={"ad": sample_ad})
             callback(event)
+        assert sender._buffer == []
+        sender.close()
 
         sender._session.post.assert_called_once()
         posted_json = sender._session.post.call_args[1]["json"]
@@ -242,6 +246,75 @@ class TestWebhookAsCallback:
         sender = WebhookSender(url="https://hooks.example.com/ads")
         assert sender.flush() is True
 
+    def test_full_batch_does_not_block_callback(self, sample_ad):
+        release = threading.Event()
+        sender = WebhookSender(url="https://hooks.example.com/ads", batch_size=2)
+        sender._session = MagicMock()
+        sender._session.post.side_effect = lambda *a, **kw: (
+            release.wait(5), MagicMock(ok=True),
+        )[1]
+        callback = sender.as_callback()
+
+        for _ in range(3):
+            callback(Event(event_type=AD_COLLECTED, data={"ad": sample_ad}))
+        # The first batch is still blocked in post(); the callback returned.
+        assert not release.is_set()
+        assert len(sender._buffer) == 1
+
+        release.set()
+        assert sender.flush() is True
+        assert sender._session.post.call_count == 2
+        sender.close()
+        assert sender._executor is None
+
+    def test_direct_send_never_overlaps_background_batch(self, sample_ad):
+        release = threading.Event()
+        batch_started = threading.Event()
+        active = 0
+        peak = 0
+        counter_lock = threading.Lock()
+
+        def post(*args, **kwargs):
+            nonlocal active, peak
+            with counter_lock:
+                active += 1
+                peak = max(peak, active)
+            if "ads" in kwargs["json"]:
+                batch_started.set()
+                release.wait(5)
+            with counter_lock:
+                active -= 1
+            return MagicMock(ok=True)
+
+        sender = WebhookSender(url="https://hooks.example.com/ads", batch_size=2)
+        sender._session = MagicMock()
+        sender._session.post.side_effect = post
+        callback = sender.as_callback()
+        for _ in range(2):
+            callback(Event(event_type=AD_COLLECTED, data={"ad": sample_ad}))
+        assert batch_started.wait(5)
+
+        direct = threading.Thread(target=sender.send, args=({"id": "direct"},))
+        direct.start()
+        direct.join(0.1)
+        assert direct.is_alive()  # waiting for the batch POST to finish
+        release.set()
+        direct.join(5)
+        sender.close()
+
+        assert sender._session.post.call_count == 2
+        assert peak == 1
+
+    def test_flush_reports_failed_background_batch(self):
+        sender = WebhookSender(
+            url="https://hooks.example.com/ads", batch_size=1, retries=1,
+        )
+        sender._session = MagicMock()
+        sender._session.post.return_value = MagicMock(ok=False, status_code=500)
+        sender._submit_batch([{"id": "ad-1"}])
+        assert sender.flush() is False
+        sender.close()
+
 
 # ---------------------------------------------------------------------------
 # Connection pooling
@@ -265,6 +338,97 @@ class TestWebhookConnectionPooling:
         assert sender._session.post.call_count == 2
 
 
+# ---------------------------------------------------------------------------
+# send_async() / as_async_callback()
+# ---------------------------------------------------------------------------
+
+
+def _async_session(*responses):
+    session = MagicMock()
+    session.post = AsyncMock(side_effect=list(responses))
+    session.close = AsyncMock()
+    return session
+
+
+class TestWebhookAsync:
+    async def test_send_async_retries_with_asyncio_sleep(self):
+        sender = WebhookSender(url="https://hooks.example.com/ads", retries=3)
+        sender._async_session = _async_session(
+            MagicMock(ok=False, status_code=500),
+            ConnectionError("reset"),
+            MagicMock(ok=True, status_code=200),
+        )
+        with patch("meta_ads_collector.webhooks.asyncio.sleep", new=AsyncMock()) as sleep:
+            assert await sender.send_async({"id": "ad-1"}) is True
+        assert [c.args[0] for c in sleep.call_args_list] == [0.1, 0.2]
+        assert sender._async_session.post.call_count == 3
+
+    async def test_send_async_exhausted_returns_false(self):
+        sender = WebhookSender(url="https://hooks.example.com/ads", retries=2)
+        sender._async_session = _async_session(RuntimeError("x"), RuntimeError("y"))
+        with patch("meta_ads_collector.webhooks.asyncio.sleep", new=AsyncMock()):
+            assert await sender.send_async({"id": "ad-1"}) is False
+
+    async def test_async_callback_schedules_sends(self, sample_ad):
+        sender = WebhookSender(url="https://hooks.example.com/ads")
+        sender._session = MagicMock()
+        session = _async_session(MagicMock(ok=True), MagicMock(ok=True))
+        sender._async_session = session
+        callback = sender.as_async_callback()
+
+        for _ in range(2):
+            callback(Event(event_type=AD_COLLECTED, data={"ad": sample_ad}))
+        callback(Event(event_type="page_fetched", data={}))
+
+        await sender.aclose()
+        assert session.post.call_count == 2
+        assert session.post.call_args[1]["json"]["id"] == "ad-123"
+        session.close.assert_awaited_once()
+        sender._session.post.assert_not_called()
+        assert not sender._tasks
+
+    async def test_async_callback_bounds_in_flight_sends(self, sample_ad):
+        sender = WebhookSender(url="https://hooks.example.com/ads")
+        in_flight = 0
+        peak = 0
+
+        async def slow_post(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(ok=True)
+
+        session = MagicMock()
+        session.post = slow_post
+        session.close = AsyncMock()
+        sender._async_session = session
+        callback = sender.as_async_callback()
+
+        for _ in range(20):
+            callback(Event(event_type=AD_COLLECTED, data={"ad": sample_ad}))
+        assert len(sender._tasks) == sender._max_pending
+
+        await sender.aclose()
+        assert peak == sender._max_pending
+        assert not sender._async_queue and not sender._tasks
+
+    async def test_async_callback_batches_and_aclose_flushes(self, sample_ad):
+        sender = WebhookSender(url="https://hooks.example.com/ads", batch_size=2)
+        session = _async_session(MagicMock(ok=True), MagicMock(ok=True))
+        sender._async_session = session
+        callback = sender.as_async_callback()
+
+        for _ in range(3):
+            callback(Event(event_type=AD_COLLECTED, data={"ad": sample_ad}))
+        await sender.aclose()
+
+        counts = [c[1]["json"]["count"] for c in session.post.call_args_list]
+        assert counts == [2, 1]
+        assert sender._buffer == []
+
+
 # ---------------------------------------------------------------------------
 # CLI flag
 # ---------------------------------------------------------------------------